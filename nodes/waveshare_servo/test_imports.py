@@ -15,7 +15,7 @@ try:
     print("Testing imports...")
     from waveshare_servo.servo.models import ServoSettings
     from waveshare_servo.servo.controller import Servo
-    from waveshare_servo.config_handler import ConfigHandler
+    from waveshare_servo.config.handler import ConfigHandler
     print("Successfully imported ServoSettings")
     print("Successfully imported Servo")
     print("Successfully imported ConfigHandler")
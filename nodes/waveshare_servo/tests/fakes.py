@@ -0,0 +1,83 @@
+"""Lightweight fakes used by the waveshare_servo tests."""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, List, Tuple
+
+from waveshare_servo.servo.models import ServoSettings
+
+
+class FakeSerial:
+    """In-memory stand-in for a PySerial connection.
+
+    Every `write()` is recorded in `frames` (and appended to `buf`). Canned
+    replies queued in `responses` are delivered one per write, as a servo
+    would answer a command.
+    """
+
+    def __init__(self, port: str = "/dev/ttyFAKE"):
+        self.port = port
+        self.is_open = True
+        self.buf = bytearray()
+        self.frames: List[bytes] = []
+        self.responses: Deque[bytes] = deque()
+        self._rx = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self.frames.append(bytes(data))
+        self.buf += data
+        if self.responses:
+            self._rx += self.responses.popleft()
+        return len(data)
+
+    def flush(self):
+        pass
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._rx)
+
+    def read(self, size: int = 1) -> bytes:
+        data = bytes(self._rx[:size])
+        del self._rx[:size]
+        return data
+
+    def readline(self) -> bytes:
+        end = self._rx.find(b"\n") + 1 or len(self._rx)
+        return self.read(end)
+
+    def close(self):
+        self.is_open = False
+
+
+@dataclass
+class FakeNode:
+    """Dora node stand-in recording every `send_output` call."""
+
+    outputs: List[Tuple[str, Any]] = field(default_factory=list)
+
+    def send_output(self, output_id: str, data: Any, metadata: Any = None):
+        self.outputs.append((output_id, data))
+
+
+@dataclass
+class FakeServo:
+    """Servo stand-in recording the requested positions."""
+
+    settings: ServoSettings
+    moves: List[int] = field(default_factory=list)
+    succeed: bool = True
+    button_state: int = 0
+    last_axis_write_ns: int = 0
+
+    @property
+    def id(self) -> int:
+        return self.settings.id
+
+    def move(self, position: int) -> bool:
+        self.moves.append(position)
+        return self.succeed
+
+    def axis_position(self, axis_value: float) -> int:
+        min_pulse, _, _, span = self.settings.pulse_bounds
+        return int(round(min_pulse + axis_value * span))
@@ -1,16 +1,52 @@
 """Unit tests for the waveshare_servo node components."""
 
-import json
+import gc
+import importlib.util
+import signal
+import sys
+import threading
+import time
+import weakref
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from waveshare_servo.main import (
-    ConfigHandler,
-    Servo,
-    ServoManager,
-    ServoScanner,
-    ServoSettings,
-    run,
+import pyarrow as pa
+import pytest
+
+from fakes import FakeNode, FakeSerial, FakeServo
+
+import waveshare_servo.config.handler as config_handler
+from waveshare_servo.config.handler import ConfigHandler
+from waveshare_servo.inputs.detach_servo import detach_servo
+from waveshare_servo.inputs.gamepad_event import (
+    calculate_position,
+    find_servos_by_control,
+    handle_axis_control,
+    handle_gamepad_event,
 )
+from waveshare_servo.inputs.gamepad_flush import flush_pending_axis_moves
+from waveshare_servo.inputs.move_servo import move_servo
+from waveshare_servo.inputs.update_servo_setting import update_servo_setting
+from waveshare_servo.main import CONFIG_RELOADED_KEY, process_event
+from waveshare_servo.servo.axis_group import NOT_IN_GROUP, shared_axis_positions
+from waveshare_servo.servo.controller import Servo
+from waveshare_servo.servo.discovery import discover_servos
+from waveshare_servo.servo.gamepad_math import axis_absolute, axis_relative, button_toggle
+from waveshare_servo.servo.models import ServoSettings
+from waveshare_servo.servo.port_finder import find_servo_port
+from waveshare_servo.servo.protocol import build_ping_frame, build_word_write_frame, read_response
+from waveshare_servo.servo.scanner import BAUDRATE, FULL_SCAN_INTERVAL, ServoScanner
+from waveshare_servo.servo.serial_tuning import enable_low_latency
+from waveshare_servo.servo.serial_writer import SerialWriter
+from waveshare_servo.servo.wiggle import wiggle_trajectory
+from waveshare_servo.utils import json_codec
+from waveshare_servo.utils.event_processor import extract_event_data, extract_servo_id
+from waveshare_servo.utils.serial_worker import SerialWorker
+
+# SCS status packets (no error, no parameters) for servo IDs 1 and 3
+STATUS_ID_1 = b"\xff\xff\x01\x02\x00\xfc"
+STATUS_ID_3 = b"\xff\xff\x03\x02\x00\xfa"
+STATUS_ID_5 = b"\xff\xff\x05\x02\x00\xf8"
 
 
 class TestServoSettings:
@@ -21,12 +57,13 @@ class TestServoSettings:
         settings = ServoSettings(id=2)
         assert settings.id == 2
         assert settings.alias == ""
-        assert settings.min_pulse == 500
-        assert settings.max_pulse == 2500
+        assert settings.min_pulse == 0
+        assert settings.max_pulse == 1023
         assert settings.speed == 1000
         assert settings.calibrated is False
         assert settings.position == 0
         assert settings.invert is False
+        assert settings.gamepad_config == {}
 
     def test_to_dict(self):
         """Test conversion to dictionary."""
@@ -35,57 +72,191 @@ class TestServoSettings:
         assert settings_dict["id"] == 3
         assert settings_dict["alias"] == "Head"
 
+    def test_gamepad_mapping_follows_config(self):
+        """Test that assigning gamepad_config refreshes the parsed mapping."""
+        settings = ServoSettings(id=2)
+        assert settings.gamepad_mapping is None
+
+        settings.gamepad_config = {"type": "axis", "mode": "absolute", "multiplier": "2"}
+        mapping = settings.gamepad_mapping
+        assert (mapping.control_type, mapping.mode, mapping.multiplier) == ("axis", "absolute", 2.0)
+        assert mapping.invert is False
+        assert mapping.analog and not mapping.direct_absolute  # No explicit input range
+        settings.gamepad_config = {"type": "axis", "mode": "absolute", "input_range": "unipolar"}
+        assert settings.gamepad_mapping.direct_absolute
+        settings.gamepad_config = {"type": "button", "mode": "toggle"}
+        assert not settings.gamepad_mapping.analog
+        assert "gamepad_mapping" not in settings.to_dict()
+
+    def test_pulse_bounds_follow_limits(self):
+        """Test that assigning min/max_pulse refreshes the cached bounds."""
+        settings = ServoSettings(id=2, min_pulse=100, max_pulse=900)
+        assert settings.pulse_bounds == (100, 900, 500.0, 800)
+        settings.max_pulse = 500
+        assert settings.pulse_bounds == (100, 500, 300.0, 400)
+        assert "_pulse_bounds" not in settings.to_dict()
+
+        settings.gamepad_config = {}
+        assert settings.gamepad_mapping is None
+
 
 class TestServoScanner:
-    """Tests for the ServoScanner class (port finding, connection, discovery)."""
+    """Tests for port finding, connection and discovery."""
 
+    @patch("os.path.exists", return_value=False)
     @patch("serial.tools.list_ports.comports")
-    def test_find_servo_port(self, mock_comports):
+    def test_find_servo_port(self, mock_comports, mock_exists):
         """Test finding servo port."""
-        # Mock port with USB-Serial in description
-        mock_port = MagicMock()
-        mock_port.device = "/dev/ttyUSB0"
-        mock_port.description = "USB-Serial Controller"
-        mock_comports.return_value = [mock_port]
-
-        scanner = ServoScanner()
-        port = scanner.find_servo_port()
-        assert port == "/dev/ttyUSB0"
+        mock_comports.return_value = [
+            SimpleNamespace(device="/dev/ttyUSB0", description="USB-Serial Controller")
+        ]
+        assert find_servo_port() == "/dev/ttyUSB0"
 
+    @patch("time.sleep")
     @patch("serial.Serial")
-    @patch.object(ServoScanner, "find_servo_port", return_value="/dev/ttyUSB0")
-    def test_connect(self, mock_find_port, mock_serial):
+    @patch("waveshare_servo.servo.scanner.find_servo_port", return_value="/dev/ttyUSB0")
+    def test_connect(self, mock_find_port, mock_serial, mock_sleep, tmp_path):
         """Test connection to servo controller."""
-        mock_serial.return_value.is_open = True
-        scanner = ServoScanner()
-        result = scanner.connect()
-        assert result is True
-        mock_serial.assert_called_once_with("/dev/ttyUSB0", 115200, timeout=0.5)
-
-    @patch.object(ServoScanner, "connect", return_value=True)
-    def test_discover_servos(self, mock_connect):
-        """Test servo discovery."""
-        scanner = ServoScanner()
-        scanner.serial_conn = MagicMock()
-
-        # Mock responses for two servos
-        scanner.serial_conn.readline.side_effect = [
-            b"OK\r\n",  # ID 1
-            b"\r\n",  # ID 2 (no response)
-            b"OK\r\n",  # ID 3
-        ]
-
-        # Mock the range function to only check a few IDs
-        original_range = range
-        try:
-            # Replace global range function temporarily
-            __builtins__["range"] = lambda *args: [1, 2, 3]
-            result = scanner.discover_servos()
-        finally:
-            # Restore original range function
-            __builtins__["range"] = original_range
-
-        assert result == {1, 3}  # IDs 1 and 3 should be found
+        mock_serial.return_value = FakeSerial("/dev/ttyUSB0")
+        scanner = ServoScanner(tmp_path / "scan_cache.json")
+        assert scanner.connect() is True
+        mock_serial.assert_called_once_with("/dev/ttyUSB0", BAUDRATE, timeout=0.5)
+
+    def test_low_latency_falls_back_on_unsupported_port(self, tmp_path):
+        """Test tuning a port without low-latency support is harmless."""
+        conn = FakeSerial()
+        missing = str(tmp_path / "missing" / "{device}" / "latency_timer")
+        with patch("waveshare_servo.servo.serial_tuning.LATENCY_TIMER_PATH", missing):
+            assert enable_low_latency(conn) is False
+        assert conn.is_open
+        conn.responses.append(STATUS_ID_1)
+        conn.write(build_ping_frame(1))
+        assert conn.read(len(STATUS_ID_1)) == STATUS_ID_1
+
+    def test_low_latency_uses_sysfs_timer(self, tmp_path):
+        """Test the sysfs latency timer is lowered when pyserial cannot do it."""
+        (tmp_path / "ttyFAKE").mkdir()
+        path = str(tmp_path / "{device}" / "latency_timer")
+        with patch("waveshare_servo.servo.serial_tuning.LATENCY_TIMER_PATH", path):
+            assert enable_low_latency(FakeSerial()) is True
+        assert (tmp_path / "ttyFAKE" / "latency_timer").read_text() == "1"
+
+    def test_discover_servos(self, tmp_path):
+        """Test servo discovery with a single batched write."""
+        scanner = ServoScanner(tmp_path / "scan_cache.json")
+        scanner.port = "/dev/ttyFAKE"
+        scanner.serial_conn = FakeSerial()
+        scanner.serial_conn.responses.append(STATUS_ID_1 + STATUS_ID_3)
+
+        result = scanner.discover_servos()
+
+        assert result == {1, 3}
+        assert len(scanner.serial_conn.frames) == 1
+        assert scanner.serial_conn.frames[0].startswith(build_ping_frame(1))
+
+    def test_discover_servos_uses_cache(self, tmp_path):
+        """Test that cached IDs are verified without a full sweep."""
+        cache_path = tmp_path / "scan_cache.json"
+        scanner = ServoScanner(cache_path)
+        scanner.port = "/dev/ttyFAKE"
+        scanner.serial_conn = FakeSerial()
+        scanner.serial_conn.responses.append(STATUS_ID_1 + STATUS_ID_3)
+        scanner.discover_servos()
+        assert cache_path.exists()
+
+        # A fresh scanner reads the cache and only pings the known IDs
+        scanner = ServoScanner(cache_path)
+        scanner.port = "/dev/ttyFAKE"
+        scanner.serial_conn = FakeSerial()
+        scanner.serial_conn.responses.append(STATUS_ID_1 + STATUS_ID_3)
+        assert scanner.discover_servos() == {1, 3}
+        assert scanner.serial_conn.frames == [build_ping_frame(1) + build_ping_frame(3)]
+
+    def test_stale_cache_triggers_full_scan(self, tmp_path):
+        """Test a cached servo that stopped answering forces a full sweep."""
+        cache_path = tmp_path / "scan_cache.json"
+        scanner = ServoScanner(cache_path)
+        scanner.port = "/dev/ttyFAKE"
+        scanner.serial_conn = FakeSerial()
+        scanner.serial_conn.responses.append(STATUS_ID_1 + STATUS_ID_3)
+        scanner.discover_servos()
+
+        scanner.serial_conn = FakeSerial()
+        scanner.serial_conn.responses.extend([STATUS_ID_1, STATUS_ID_1 + STATUS_ID_5])
+        assert scanner.discover_servos() == {1, 5}
+        assert len(scanner.serial_conn.frames) == 2
+        assert scanner.serial_conn.frames[1].startswith(build_ping_frame(1) + build_ping_frame(2))
+
+        # The new ID set is persisted for the next process
+        scanner = ServoScanner(cache_path)
+        scanner.port = "/dev/ttyFAKE"
+        assert scanner._load_cached_ids() == {1, 5}
+
+    def test_full_scan_forced_after_interval(self, tmp_path):
+        """Test a full sweep runs again after FULL_SCAN_INTERVAL cache hits."""
+        scanner = ServoScanner(tmp_path / "scan_cache.json")
+        scanner.port = "/dev/ttyFAKE"
+        scanner.serial_conn = FakeSerial()
+        scanner.serial_conn.responses.append(STATUS_ID_1)
+        scanner.discover_servos()
+
+        cached_ping = build_ping_frame(1)
+        for _ in range(FULL_SCAN_INTERVAL):
+            scanner.serial_conn.frames.clear()
+            scanner.serial_conn.responses.append(STATUS_ID_1)
+            assert scanner.discover_servos() == {1}
+            assert scanner.serial_conn.frames == [cached_ping]
+
+        scanner.serial_conn.frames.clear()
+        scanner.serial_conn.responses.append(STATUS_ID_1)
+        assert scanner.discover_servos() == {1}
+        assert scanner.serial_conn.frames[0] != cached_ping
+
+    def test_scan_cache_lives_outside_repository(self, tmp_path):
+        """Test the default scan cache path follows XDG_CACHE_HOME."""
+        with patch.dict("os.environ", {"XDG_CACHE_HOME": str(tmp_path)}):
+            scanner = ServoScanner()
+        assert scanner.cache_path == tmp_path / "wall-e-dora" / "servo_scan_cache.json"
+
+
+class TestResponseReading:
+    """Tests for reading and splitting servo status frames."""
+
+    def test_read_response_times_out_empty(self):
+        """Test a silent bus returns no bytes once the timeout expires."""
+        start = time.monotonic()
+        assert read_response(FakeSerial(), 0.02) == b""
+        assert time.monotonic() - start >= 0.02
+
+    def test_read_response_joins_split_frame(self):
+        """Test a frame arriving in two chunks is returned whole."""
+        conn = FakeSerial()
+        conn._rx += STATUS_ID_1[:3]
+        threading.Timer(0.01, conn._rx.extend, (STATUS_ID_1[3:],)).start()
+        assert read_response(conn, 1.0, size=len(STATUS_ID_1)) == STATUS_ID_1
+
+    def test_discovery_skips_bad_checksum(self):
+        """Test a status frame with a corrupt checksum is ignored."""
+        conn = FakeSerial()
+        conn.responses.append(STATUS_ID_1[:-1] + b"\x00" + STATUS_ID_3)
+        assert discover_servos(conn, [1, 3]) == {3}
+
+    def test_discovery_splits_back_to_back_frames(self):
+        """Test consecutive frames are all found and a truncated tail is not."""
+        conn = FakeSerial()
+        conn.responses.append(STATUS_ID_1 + STATUS_ID_3 + STATUS_ID_5 + STATUS_ID_1[:4])
+        assert discover_servos(conn, [1, 3, 5]) == {1, 3, 5}
+
+        conn = FakeSerial()
+        conn.responses.append(STATUS_ID_3 + STATUS_ID_5[:4])
+        assert discover_servos(conn, [3, 5]) == {3}
+
+    def test_discovery_ignores_echoed_pings(self):
+        """Test an adapter echoing the PING batch does not report every pinged ID."""
+        batch = b"".join(build_ping_frame(servo_id) for servo_id in (1, 3, 5))
+        conn = FakeSerial()
+        conn.responses.append(batch + STATUS_ID_3)
+        assert discover_servos(conn, [1, 3, 5]) == {3}
 
 
 class TestServo:
@@ -93,41 +264,106 @@ class TestServo:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.serial_conn = MagicMock()
+        self.serial_conn = FakeSerial()
         self.settings = ServoSettings(id=2, alias="Test Servo")
         self.servo = Servo(self.serial_conn, self.settings)
 
-    def test_send_command(self):
-        """Test sending commands to servo."""
-        self.serial_conn.readline.return_value = b"OK\r\n"
-        response = self.servo.send_command("PING")
-        assert response == "OK"
-        self.serial_conn.write.assert_called_once_with(b"#2PING\r\n")
-
-    def test_move(self):
-        """Test moving servo to position."""
-        self.serial_conn.readline.return_value = b"OK\r\n"
-        result = self.servo.move(1500)
-        assert result is True
-        self.serial_conn.write.assert_called_once_with(b"#2P1500T1000\r\n")
-        assert self.servo.settings.position == 1500
+    def test_send_ping_command(self):
+        """Test sending a PING to the servo."""
+        self.serial_conn.responses.append(b"\xff\xff\x02\x02\x00\xfb")
+        assert self.servo.send_command("PING") == "OK"
+        assert self.serial_conn.frames == [build_ping_frame(2)]
+
+    def test_send_position_command(self):
+        """Test that goal position and speed frames are coalesced."""
+        assert self.servo.send_command("P500T1000") == "OK"
+        self.servo.writer.flush()
+        assert self.serial_conn.frames == [
+            build_word_write_frame(2, 42, 500) + build_word_write_frame(2, 46, 1000)
+        ]
 
     def test_move_clamping(self):
-        """Test that move clamps values to min/max range."""
-        self.serial_conn.readline.return_value = b"OK\r\n"
-        # Try to move beyond max_pulse
-        self.servo.move(3000)
-        # Command should use max_pulse instead
-        self.serial_conn.write.assert_called_once_with(b"#2P2500T1000\r\n")
-
-    def test_wiggle(self):
-        """Test wiggle functionality."""
-        self.serial_conn.readline.return_value = b"OK\r\n"
-        with patch("time.sleep"):
-            result = self.servo.wiggle()
-        assert result is True
-        # Should have multiple write calls for the wiggle sequence
-        assert self.serial_conn.write.call_count > 3
+        """Test that move clamps values to the min/max range."""
+        self.settings.max_pulse = 800
+        with patch.object(Servo, "_move_with_sdk", return_value=True) as mock_move:
+            assert self.servo.move(3000) is True
+        mock_move.assert_called_once_with(800)
+
+    def test_move_invert(self):
+        """Test that inverted servos mirror the target position."""
+        self.settings.invert = True
+        with patch.object(Servo, "_move_with_sdk", return_value=True) as mock_move:
+            self.servo.move(100)
+        mock_move.assert_called_once_with(923)
+
+    def test_axis_position(self):
+        """Test axis values map linearly onto the pulse range at full resolution."""
+        self.settings.min_pulse, self.settings.max_pulse = 0, 1023
+        assert self.servo.axis_position(0.0) == 0
+        assert self.servo.axis_position(1.0) == 1023
+        assert self.servo.axis_position(1.5) == 1023
+        assert self.servo.axis_position(0.5005) == 512
+        assert self.servo.axis_position(0.5015) == 513  # Finer than a 256-step table
+
+        # Follows changed pulse bounds
+        self.settings.min_pulse, self.settings.max_pulse = 100, 500
+        assert self.servo.axis_position(1.0) == 500
+
+    def test_wiggle_trajectory(self):
+        """Test the wiggle sequence alternates and ends at the start position."""
+        trajectory = wiggle_trajectory(512, 40, 3).tolist()
+        assert trajectory == [552, 472, 552, 472, 552, 472, 512]
+        assert wiggle_trajectory(10, 40, 1).tolist() == [50, 0, 10]
+
+
+class TestSerialWriter:
+    """Tests for write coalescing on the shared serial connection."""
+
+    def test_writes_within_delay_are_sent_together(self):
+        """Test frames appended within the flush delay go out in one write."""
+        conn = FakeSerial()
+        writer = SerialWriter(conn, flush_delay=0.01)
+        for frame in (b"\x01", b"\x02\x03", b"\x04"):
+            writer.write(frame)
+        assert conn.frames == []
+        deadline = time.monotonic() + 2.0
+        while not conn.frames and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert conn.frames == [b"\x01\x02\x03\x04"]
+
+    def test_event_boundary_flushes_pending_frames(self):
+        """Test process_event sends frames still waiting at the end of an event."""
+        conn = FakeSerial()
+        writer = SerialWriter(conn, flush_delay=60.0)
+        writer.write(b"\x05\x06")
+        process_event({"type": "INPUT", "id": "unknown_input"}, {"scanner": SimpleNamespace(writer=writer)})
+        assert conn.frames == [b"\x05\x06"]
+        writer.flush()  # Nothing pending, nothing written
+        assert conn.frames == [b"\x05\x06"]
+
+    def test_event_boundary_skips_worker_when_nothing_pending(self):
+        """Test events with an empty writer do not queue a flush on the serial worker."""
+        writer = SerialWriter(FakeSerial(), flush_delay=60.0)
+        worker = MagicMock()
+        context = {"scanner": SimpleNamespace(writer=writer), "serial_worker": worker, "pending_axis_positions": {}}
+        process_event({"type": "INPUT", "id": "gamepad_flush"}, context)
+        worker.submit.assert_not_called()
+
+        writer.write(b"\x05\x06")
+        assert writer.pending == 2
+        process_event({"type": "INPUT", "id": "unknown_input"}, context)
+        worker.submit.assert_called_once_with(writer.flush)
+
+    def test_writer_is_dropped_with_its_connection(self):
+        """Test the shared writer registry does not keep connections alive."""
+        conn = FakeSerial()
+        writer = SerialWriter.for_connection(conn)
+        assert SerialWriter.for_connection(conn) is writer
+        assert writer.port == conn.port
+        conn_ref = weakref.ref(conn)
+        del conn, writer
+        gc.collect()
+        assert conn_ref() is None
 
 
 class TestConfigHandler:
@@ -135,128 +371,448 @@ class TestConfigHandler:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.node = MagicMock()
-        self.config = ConfigHandler(self.node)
-
-    def test_get_servo_path(self):
-        """Test generating config paths."""
-        assert self.config.get_servo_path(2) == "servo.2"
-        assert self.config.get_servo_path(3, "alias") == "servo.3.alias"
-
-    def test_update_setting(self):
-        """Test updating settings."""
-        self.config.update_setting("servo.2.alias", "Head")
-        self.node.send_output.assert_called_once()
-        args = self.node.send_output.call_args[0]
-        assert args[0] == "update_setting"
-
-        # Create a mock to simulate PyArrow array
-        mock_array = MagicMock()
-        mock_array.as_py.return_value = [
-            json.dumps({"path": "servo.2.alias", "value": "Head"})
-        ]
-        self.node.send_output.return_value = mock_array
-
-        # Extract the data from PyArrow array
-        array = self.node.send_output.return_value
-        data_json = array.as_py()[0]
-        data = json.loads(data_json)
-        assert data["path"] == "servo.2.alias"
-        assert data["value"] == "Head"
-
-    def test_handle_settings_updated(self):
+        self.node = FakeNode()
+        self.configs = []
+
+    def teardown_method(self):
+        """Stop the save threads of the handlers created by the test."""
+        for config in self.configs:
+            config.close()
+
+    def make_config(self, tmp_path):
+        with patch.object(config_handler, "project_root", str(tmp_path)):
+            config = ConfigHandler(self.node)
+        self.configs.append(config)
+        return config
+
+    def test_update_servo_setting(self, tmp_path):
+        """Test that updates are cached and written by flush."""
+        config = self.make_config(tmp_path)
+        config.update_servo_setting(2, "alias", "Head")
+        assert config.get_servo_settings(2) == {"alias": "Head"}
+
+        config.flush()
+        assert self.make_config(tmp_path).get_servo_settings(2) == {"alias": "Head"}
+
+    def test_update_servo_properties(self, tmp_path):
+        """Test that several properties are applied in one update."""
+        config = self.make_config(tmp_path)
+        config.update_servo_setting(2, "alias", "Head")
+        assert config.update_servo_properties(
+            2, {"attached_control": "", "gamepad_config": {}}
+        ) is True
+        assert config.get_servo_settings(2) == {
+            "alias": "Head", "attached_control": "", "gamepad_config": {}
+        }
+        assert config.update_servo_properties(2, {"alias": "Head"}) is False
+
+    def test_handle_settings_updated(self, tmp_path):
         """Test handling settings updates."""
+        config = self.make_config(tmp_path)
+
         # Test updating a specific property
-        result = self.config.handle_settings_updated("servo.2.alias", "Head")
-        assert result is True
-        assert self.config.cached_settings[2]["alias"] == "Head"
+        assert config.handle_settings_updated("servo.2.alias", "Head") is True
+        assert config.cached_settings["2"]["alias"] == "Head"
 
         # Test updating a whole servo object
         servo_settings = {"id": 3, "alias": "Arm", "speed": 2000}
-        result = self.config.handle_settings_updated("servo.3", servo_settings)
-        assert result is True
-        assert self.config.cached_settings[3] == servo_settings
-
-
-class TestServoManager:
-    """Tests for the ServoManager class (orchestration logic)."""
+        assert config.handle_settings_updated("servo.3", servo_settings) is True
+        assert config.cached_settings["3"] == servo_settings
+
+        # Paths outside the servo namespace are ignored
+        assert config.handle_settings_updated("tracks.speed", 1) is False
+
+    def test_unchanged_setting_is_not_saved(self, tmp_path):
+        """Test that re-applying the cached value does not schedule a write."""
+        config = self.make_config(tmp_path)
+        assert config.update_servo_setting(2, "position", 300) is True
+        config.flush()
+
+        assert config.update_servo_setting(2, "position", 300) is False
+        assert config.handle_settings_updated("servo.2.position", 300) is True
+        assert not config._dirty.is_set()
+
+
+    def test_close_stops_thread_and_restores_hooks(self, tmp_path):
+        """Test close writes pending changes and undoes install_process_hooks."""
+        previous = signal.getsignal(signal.SIGTERM)
+        config = self.make_config(tmp_path)
+        config.install_process_hooks()
+        assert signal.getsignal(signal.SIGTERM) == config._handle_sigterm
+
+        config.update_servo_setting(2, "alias", "Head")
+        config.close()
+        assert not config._save_thread.is_alive()
+        assert signal.getsignal(signal.SIGTERM) == previous
+        with open(config.config_file_path) as f:
+            assert json_codec.loads(f.read()) == {"2": {"alias": "Head"}}
+
+    def test_reload_picks_up_external_edit(self, tmp_path):
+        """Test reload re-reads the file and drops unsaved in-memory changes."""
+        config = self.make_config(tmp_path)
+        config.update_servo_setting(2, "alias", "Head")
+        with open(config.config_file_path, "w") as f:
+            f.write('{"2": {"alias": "Arm", "min_pulse": 100}}')
+        config.reload()
+        assert config.get_servo_settings(2) == {"alias": "Arm", "min_pulse": 100}
+        assert not config._dirty.is_set()
+
+    def test_reload_keeps_settings_on_malformed_file(self, tmp_path, caplog):
+        """Test a malformed or empty file leaves the cached settings untouched."""
+        config = self.make_config(tmp_path)
+        config.update_servo_setting(2, "alias", "Head")
+        config.flush()
+        for content in ('{"2": {"alias": ', ""):
+            with open(config.config_file_path, "w") as f:
+                f.write(content)
+            config.reload()
+            assert config.get_servo_settings(2) == {"alias": "Head"}
+        assert "Error reloading settings" in caplog.text
+
+
+def _load_stdlib_json_codec():
+    """Load a private copy of json_codec as if orjson were not installed."""
+    spec = importlib.util.spec_from_file_location("json_codec_stdlib", json_codec.__file__)
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {"orjson": None}):
+        spec.loader.exec_module(module)
+    return module
+
+
+class TestJsonCodec:
+    """Tests for both JSON codec backends."""
+
+    DOCUMENT = {"servos": [{"id": 1, "alias": "Köpfchen", "position": 512}], "ok": True}
+
+    def _assert_round_trip(self, codec):
+        text = codec.dumps(self.DOCUMENT)
+        raw = codec.dumps_bytes(self.DOCUMENT)
+        assert isinstance(text, str)
+        assert isinstance(raw, bytes)
+        assert " " not in text
+        assert raw == text.encode()
+        for encoded in (text, raw, memoryview(raw)):
+            assert codec.loads(encoded) == self.DOCUMENT
+        with pytest.raises(codec.JSONDecodeError):
+            codec.loads('{"id": ')
+
+    def test_orjson_round_trip(self):
+        """Test encoding and decoding through orjson."""
+        pytest.importorskip("orjson")
+        assert hasattr(json_codec, "orjson")
+        self._assert_round_trip(json_codec)
+
+    def test_stdlib_round_trip(self):
+        """Test encoding and decoding through the json fallback."""
+        codec = _load_stdlib_json_codec()
+        assert not hasattr(codec, "orjson")
+        self._assert_round_trip(codec)
+
+    def test_backends_agree(self):
+        """Test both backends produce identical output."""
+        codec = _load_stdlib_json_codec()
+        assert codec.dumps(self.DOCUMENT) == json_codec.dumps(self.DOCUMENT)
+        assert codec.loads(json_codec.dumps_bytes(self.DOCUMENT)) == self.DOCUMENT
+
+
+class TestMoveServo:
+    """Tests for the move_servo input handling."""
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.node = MagicMock()
-        with patch.object(ServoScanner, "connect", return_value=False):
-            self.manager = ServoManager(self.node)
-            self.manager.scanner = MagicMock()
-            self.manager.config = MagicMock()
-
-    def test_broadcast_servo_status(self):
-        """Test broadcasting servo status."""
-        # Create a mock servo
-        settings = ServoSettings(id=2, alias="Test")
-        servo = MagicMock()
-        servo.settings = settings
-        self.manager.servos = {2: servo}
-
-        # Test the broadcast
-        self.manager.broadcast_servo_status(2)
-        self.node.send_output.assert_called_once()
-        args = self.node.send_output.call_args[0]
-        assert args[0] == "servo_status"
-
-    def test_handle_move_servo(self):
-        """Test handling move servo command."""
-        # Create a mock servo
-        servo = MagicMock()
-        servo.move.return_value = True
-        settings = ServoSettings(id=2)
-        servo.settings = settings
-        self.manager.servos = {2: servo}
-
-        # Test the move handler
-        result = self.manager.handle_move_servo(2, 1500)
-        assert result is True
-        servo.move.assert_called_once_with(1500)
-
-        # Verify config update
-        self.manager.config.update_servo_setting.assert_called_once_with(
-            2, "position", 1500
-        )
-
-    def test_process_event_move_servo(self):
-        """Test processing move_servo event."""
-        # Mock handle_move_servo
-        self.manager.handle_move_servo = MagicMock(return_value=True)
-
-        # Create test event with mock PyArrow array
-        mock_array = MagicMock()
-        mock_array.as_py.return_value = [json.dumps({"id": 2, "position": 1500})]
-
-        event = {"id": "move_servo", "type": "INPUT", "data": mock_array}
-
-        # Process the event
-        self.manager.process_event(event)
-        self.manager.handle_move_servo.assert_called_once_with(2, 1500)
-
-
-def test_run():
-    """Test the main run function of the node."""
-    # Create mock node and manager
-    node = MagicMock()
-
-    # Mock the node to return a single event then stop
-    mock_event = {"id": "scan_servos", "type": "INPUT", "data": MagicMock()}
-    node.__iter__.return_value = [mock_event]
-
-    # Mock the ServoManager
-    with patch.object(ServoManager, "initialize"), patch.object(
-        ServoManager, "process_event"
-    ), patch.object(ServoManager, "scan_for_servos"), patch(
-        "time.time", side_effect=[0, 11]
-    ):  # Trigger scan (11-0 > 10)
-        run(node)
-
-        # Verify manager was initialized and event processed
-        ServoManager.initialize.assert_called_once()
-        ServoManager.process_event.assert_called_once_with(mock_event)
-        # Verify scan was triggered by timer
-        assert ServoManager.scan_for_servos.call_count == 1
+        self.node = FakeNode()
+        self.servo = FakeServo(ServoSettings(id=2))
+        self.configs = []
+
+    def teardown_method(self):
+        """Stop the save threads of the handlers created by the test."""
+        for config in self.configs:
+            config.close()
+
+    def make_context(self, tmp_path):
+        with patch.object(config_handler, "project_root", str(tmp_path)):
+            config = ConfigHandler(self.node)
+        self.configs.append(config)
+        return {
+            "node": self.node,
+            "config": config,
+            "servos": {2: self.servo},
+            "scanner": SimpleNamespace(writer=None),
+            "next_available_id": 3,
+            "control_axis_groups": {},
+            "last_axis_values": {},
+            "pending_axis_positions": {},
+        }
+
+    def test_move_servo(self, tmp_path):
+        """Test moving a servo updates config and broadcasts its status."""
+        context = self.make_context(tmp_path)
+        assert move_servo(context, 2, 700) is True
+        assert self.servo.moves == [700]
+        assert self.servo.settings.position == 700
+        assert context["config"].get_servo_settings(2)["position"] == 700
+        assert [output_id for output_id, _ in self.node.outputs] == ["servo_status"]
+
+    def test_failed_queued_move_rolls_back_position(self, tmp_path, caplog):
+        """Test a queued move that fails restores the previous position and logs."""
+        context = self.make_context(tmp_path)
+        context["serial_worker"] = SerialWorker()
+        self.servo.settings.position = 500
+        self.servo.succeed = False
+        assert move_servo(context, 2, 700) is True
+        context["serial_worker"].wait_idle()
+        assert self.servo.moves == [700]
+        assert self.servo.settings.position == 500
+        assert context["config"].get_servo_settings(2)["position"] == 500
+        assert "Failed to move servo 2 to 700" in caplog.text
+
+    def test_queued_move_keeps_logical_position_of_inverted_servo(self, tmp_path):
+        """Test the worker does not overwrite the position with the inverted physical value."""
+        context = self.make_context(tmp_path)
+        context["serial_worker"] = SerialWorker()
+        servo = Servo(FakeSerial(), ServoSettings(id=2, invert=True, position=500))
+        context["servos"] = {2: servo}
+        packet_handler = MagicMock()
+        packet_handler.write2ByteTxRx.return_value = (0, 0)
+        with patch("waveshare_servo.servo.controller.PortHandler"), \
+                patch("waveshare_servo.servo.controller.PacketHandler", return_value=packet_handler), \
+                patch("waveshare_servo.servo.controller.COMM_SUCCESS", 0):
+            assert move_servo(context, 2, 100) is True
+            context["serial_worker"].wait_idle()
+        assert packet_handler.write2ByteTxRx.call_args[0][3] == 923
+        assert servo.settings.position == 100
+        assert context["config"].get_servo_settings(2)["position"] == 100
+
+    def test_move_unknown_servo(self, tmp_path):
+        """Test moving an unknown servo fails without output."""
+        context = self.make_context(tmp_path)
+        assert move_servo(context, 9, 700) is False
+        assert self.node.outputs == []
+
+    def test_process_event_move_servo(self, tmp_path):
+        """Test processing a move_servo event."""
+        context = self.make_context(tmp_path)
+        event = {
+            "id": "move_servo",
+            "type": "INPUT",
+            "value": pa.array([{"id": 2, "position": 1500}]),
+        }
+        process_event(event, context)
+        assert self.servo.moves == [1500]
+
+    def test_process_event_gamepad(self, tmp_path):
+        """Test GAMEPAD_ inputs reach the gamepad handler without the prefix."""
+        context = self.make_context(tmp_path)
+        self.servo.settings.attached_control = "FACE_1"
+        self.servo.settings.gamepad_config = {"type": "button", "mode": "momentary"}
+        process_event({"id": "GAMEPAD_FACE_1", "type": "INPUT", "value": pa.array([1.0])}, context)
+        assert self.servo.moves == [1023]
+
+    def test_sighup_reload_reaches_live_servos(self, tmp_path):
+        """Test a SIGHUP reload updates live servo settings and the control index."""
+        context = self.make_context(tmp_path)
+        config = context["config"]
+        self.servo.settings.attached_control = "LEFT_STICK_X"
+        self.servo.settings.position = 500
+        assert find_servos_by_control("LEFT_STICK_X", context) == [self.servo]
+        config.install_process_hooks(on_reload=lambda: context.__setitem__(CONFIG_RELOADED_KEY, True))
+        with open(config.config_file_path, "w") as f:
+            f.write('{"2": {"max_pulse": 800, "invert": true, "attached_control": "RIGHT_STICK_X", "position": 5}}')
+
+        signal.raise_signal(signal.SIGHUP)
+        assert self.servo.settings.max_pulse == 1023  # Applied on the event loop, not in the handler
+        process_event({"type": "INPUT", "id": "unknown_input"}, context)
+
+        settings = self.servo.settings
+        assert (settings.max_pulse, settings.invert, settings.position) == (800, True, 500)
+        assert settings.pulse_bounds == (0, 800, 400.0, 800)
+        assert find_servos_by_control("LEFT_STICK_X", context) == ()
+        assert find_servos_by_control("RIGHT_STICK_X", context) == [self.servo]
+
+    def test_control_index_follows_attach_and_detach(self, tmp_path):
+        """Test gamepad lookups use the control index kept in the context."""
+        context = self.make_context(tmp_path)
+        self.servo.settings.attached_control = "LEFT_STICK_X"
+        assert find_servos_by_control("LEFT_STICK_X", context) == [self.servo]
+        assert "control_to_servos" in context
+
+        update_servo_setting(context, 2, "attached_control", "RIGHT_STICK_Y")
+        assert find_servos_by_control("LEFT_STICK_X", context) == ()
+        assert find_servos_by_control("RIGHT_STICK_Y", context) == [self.servo]
+
+        detach_servo(context, 2)
+        assert find_servos_by_control("RIGHT_STICK_Y", context) == ()
+
+    def test_gamepad_button_event(self, tmp_path):
+        """Test gamepad values of any supported type drive a mapped servo."""
+        context = self.make_context(tmp_path)
+        self.servo.settings.attached_control = "BUTTON_A"
+        self.servo.settings.gamepad_config = {"type": "button", "mode": "momentary"}
+        for value in (pa.array([1.0]), 0.01, " 1 ", [0], pa.array(['"1"'])):
+            handle_gamepad_event({"id": "BUTTON_A", "value": value}, context)
+        assert self.servo.moves == [1023, 0, 1023, 0, 1023]
+
+    def test_gamepad_toggle_button(self, tmp_path):
+        """Test toggle buttons switch ends once per press."""
+        context = self.make_context(tmp_path)
+        self.servo.settings.attached_control = "BUTTON_B"
+        self.servo.settings.gamepad_config = {"type": "button", "mode": "toggle"}
+        for value in (1.0, 1.0, 0.0, 1.0, pa.array([], pa.float64()), 1.0):
+            handle_gamepad_event({"id": "BUTTON_B", "value": value}, context)
+        assert self.servo.moves == [1023, 0]
+
+    def test_gamepad_math(self):
+        """Test the numeric core shared by the axis and button handlers."""
+        assert axis_absolute(0.0, True, 1.0) == 0.5
+        assert axis_absolute(0.5, False, 4.0) == 0.5
+        assert axis_absolute(0.9, False, 4.0) == 1.0
+        assert axis_relative(-2.0, True, 20.0, 10.0, 0.0, 1000.0) == 0.0
+        assert button_toggle(900, 0, 1023, 511.5) == 0
+
+    def test_shared_axis_positions_match_per_servo_path(self):
+        """Test the vectorized shared-axis path matches calculate_position."""
+        configs = [
+            {"type": "axis", "mode": "absolute", "input_range": "bipolar"},
+            {"type": "axis", "mode": "absolute", "invert": True, "multiplier": 1.5},
+            {"type": "button", "mode": "absolute", "input_range": "unipolar", "invert": True},
+            {"type": "axis", "mode": "absolute", "input_range": "unipolar", "multiplier": 0.5},
+            {"type": "button", "mode": "momentary"},
+        ]
+        servos = [
+            Servo(FakeSerial(), ServoSettings(id=i + 2, min_pulse=100 * i, max_pulse=1023 - 50 * i,
+                                              gamepad_config=config))
+            for i, config in enumerate(configs)
+        ]
+        groups = {}
+        for value in (-1.0, -0.3, 0.0, 0.42, 1.0):
+            positions = shared_axis_positions(groups, "STICK", servos, value, 4)
+            for row, servo in enumerate(servos[:4]):
+                mapping = servo.settings.gamepad_mapping
+                assert positions[row] == calculate_position(
+                    servo, value, {}, "STICK", mapping.control_type, mapping.input_range
+                )
+            assert positions[4] == NOT_IN_GROUP
+        assert shared_axis_positions(groups, "STICK", servos[:3], 0.0, 4) is None
+
+    def test_gamepad_absolute_axis_fast_path(self, tmp_path):
+        """Test plain absolute axes bypass calculate_position with the same result."""
+        context = self.make_context(tmp_path)
+        self.servo.settings.attached_control = "LEFT_STICK_X"
+        self.servo.settings.gamepad_config = {
+            "type": "axis", "mode": "absolute", "input_range": "bipolar", "multiplier": 1.5
+        }
+        expected = [
+            calculate_position(self.servo, value, {}, "LEFT_STICK_X", "axis", "bipolar")
+            for value in (-0.5, 0.25)
+        ]
+        with patch("waveshare_servo.inputs.gamepad_event.calculate_position") as calc, \
+                patch("time.monotonic_ns", side_effect=[10**9, 10**9 + 10**8]):
+            for value in (-0.5, 0.25):
+                handle_gamepad_event({"id": "LEFT_STICK_X", "value": value}, context)
+        calc.assert_not_called()
+        assert self.servo.moves == expected
+
+    def test_gamepad_relative_axis(self):
+        """Test relative axis steps honour the deadzone and pulse limits."""
+        self.servo.settings.position = 500
+        assert handle_axis_control(self.servo, 0.05, "relative", 1.0, {}, "bipolar") is None
+        assert handle_axis_control(self.servo, -1.0, "relative", 1.0, {}, "bipolar") == 500 - 1023 * 0.02
+        self.servo.settings.position = 1020
+        assert handle_axis_control(self.servo, 1.0, "relative", 2.0, {}, "unipolar") == 1023
+
+    def test_gamepad_axis_writes_are_rate_limited(self, tmp_path):
+        """Test analog controls skip commands faster than 100 Hz."""
+        context = self.make_context(tmp_path)
+        self.servo.settings.attached_control = "RIGHT_TRIGGER"
+        self.servo.settings.gamepad_config = {
+            "type": "button", "mode": "relative", "input_range": "unipolar"
+        }
+        self.servo.settings.position = 500
+        with patch("time.monotonic_ns", side_effect=[10**9, 10**9 + 10**6, 10**9 + 10**8]):
+            for _ in range(3):
+                handle_gamepad_event({"id": "RIGHT_TRIGGER", "value": 1.0}, context)
+        assert self.servo.moves == [520, 540]
+
+        self.servo.settings.gamepad_config = {
+            "type": "button", "mode": "relative", "input_range": "unipolar", "multiplier": 0.05
+        }
+        with patch("time.monotonic_ns", return_value=10**9 + 2 * 10**8):
+            handle_gamepad_event({"id": "RIGHT_TRIGGER", "value": 1.0}, context)
+        assert self.servo.moves == [520, 540, 541]  # Relative steps are not jitter
+
+    def test_small_relative_steps_bypass_deadband(self, tmp_path):
+        """Test relative steps smaller than the jitter deadband still move the servo."""
+        context = self.make_context(tmp_path)
+        self.servo.settings.min_pulse, self.servo.settings.max_pulse = 400, 600
+        self.servo.settings.position = 500
+        self.servo.settings.attached_control = "LEFT_STICK_X"
+        self.servo.settings.gamepad_config = {
+            "type": "axis", "mode": "relative", "input_range": "bipolar"
+        }
+        with patch("time.monotonic_ns", side_effect=[10**9 * n for n in range(1, 4)]):
+            for _ in range(3):
+                handle_gamepad_event({"id": "LEFT_STICK_X", "value": 0.3}, context)
+        assert self.servo.moves == [501, 502, 503]
+
+    def test_rate_limited_axis_target_is_flushed(self, tmp_path):
+        """Test the latest throttled axis target is sent by the flush timer."""
+        context = self.make_context(tmp_path)
+        self.servo.settings.attached_control = "RIGHT_TRIGGER"
+        self.servo.settings.gamepad_config = {
+            "type": "button", "mode": "absolute", "input_range": "unipolar"
+        }
+        with patch("time.monotonic_ns", side_effect=[10**9, 10**9 + 10**6, 10**9 + 2 * 10**6, 10**9 + 10**7]):
+            for value in (0.2, 0.5, 0.6):
+                handle_gamepad_event({"id": "RIGHT_TRIGGER", "value": value}, context)
+            assert context["pending_axis_positions"] == {2: 614}
+            flush_pending_axis_moves(context)
+        assert self.servo.moves == [205, 614]
+        assert context["pending_axis_positions"] == {}
+
+    def test_extract_event_data_returns_fresh_objects(self):
+        """Test decoded payloads are not shared between identical events."""
+        event = {"type": "INPUT", "value": pa.array([{"id": 2, "position": 700}])}
+        first, _ = extract_event_data(event)
+        first["position"] = 0
+        second, error = extract_event_data(event)
+        assert error is None
+        assert second == {"id": 2, "position": 700}
+
+    def test_extract_servo_id(self):
+        """Test servo IDs are read from struct and plain dict payloads."""
+        assert extract_servo_id({"type": "INPUT", "value": pa.array([{"id": 4}])}) == 4
+        assert extract_servo_id({"type": "INPUT", "value": {"id": "5"}}) == 5
+        assert extract_servo_id({"type": "INPUT", "value": pa.array([{"position": 1}])}) is None
+
+    def test_unchanged_absolute_axis_is_skipped(self, tmp_path):
+        """Test an absolute axis held steady is not recomputed, unless throttled."""
+        context = self.make_context(tmp_path)
+        self.servo.settings.attached_control = "LEFT_STICK_Y"
+        self.servo.settings.gamepad_config = {"type": "button", "mode": "absolute", "input_range": "unipolar"}
+        with patch("waveshare_servo.inputs.gamepad_event.calculate_position", side_effect=[800, 900, 900]) as calc, \
+                patch("time.monotonic_ns", side_effect=[10**9, 10**9 + 10**6, 10**9 + 10**8]):
+            for value in (0.8, 0.805, 0.9, 0.9, 0.9):
+                handle_gamepad_event({"id": "LEFT_STICK_Y", "value": value}, context)
+        assert calc.call_count == 3
+        assert self.servo.moves == [800, 900]
+
+    def test_held_axis_retargets_after_mapping_change(self, tmp_path):
+        """Test a steady absolute axis is re-handled once its mapping or pulse range changes."""
+        context = self.make_context(tmp_path)
+        settings = self.servo.settings
+        settings.attached_control = "LEFT_STICK_X"
+        settings.gamepad_config = {"type": "axis", "mode": "absolute", "input_range": "unipolar"}
+        event = {"id": "LEFT_STICK_X", "value": 0.8}
+        with patch("time.monotonic_ns", side_effect=[10**9, 2 * 10**9, 3 * 10**9]):
+            handle_gamepad_event(event, context)
+            handle_gamepad_event(event, context)
+            assert self.servo.moves == [818]
+
+            settings.max_pulse = 523
+            handle_gamepad_event(event, context)
+            assert self.servo.moves == [818, 418]
+
+            settings.gamepad_config = {"type": "axis", "mode": "absolute", "input_range": "unipolar", "invert": True}
+            handle_gamepad_event(event, context)
+            handle_gamepad_event(event, context)
+        assert self.servo.moves == [818, 418, 105]
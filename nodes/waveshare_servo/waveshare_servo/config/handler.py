@@ -7,26 +7,80 @@ Note: This is a temporary direct file handler. It's intended to be
 refactored to use the central `config` node in the future.
 """
 
-import json
-import traceback
-import sys
+import atexit
+import logging
+import mmap
+import signal
+import threading
 import os
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, Tuple
 from pathlib import Path
 
-# Add the parent directory to the path for imports if needed
-current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-parent_dir = os.path.dirname(os.path.dirname(current_dir))
-project_root = os.path.dirname(parent_dir)  # Fixed: one level up from parent_dir
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
+# Repository root, which holds the shared config/ directory
+project_root = str(Path(__file__).resolve().parents[4])
 
 # Import from servo module
 from waveshare_servo.servo.models import ServoSettings
+from waveshare_servo.utils import json_codec
+
+log = logging.getLogger(__name__)
+
+# How long to collect further setting changes before writing the file (seconds)
+SAVE_DELAY = 0.1
+
+SERVO_PATH_PREFIX = "servo."
+
+# Highest ID addressable on the SCS bus (0xFE is the broadcast ID)
+MAX_SERVO_ID = 253
+
+# Stored settings not pushed into live servos on reload: the identity and
+# runtime state that the bus, not the file, is authoritative for
+RELOAD_SKIPPED_SETTINGS = ("id", "position", "voltage")
+
+# Servo ID strings seen in setting paths, mapped to their integer value
+_servo_id_cache: Dict[str, int] = {}
+
+
+def parse_servo_setting_path(setting_path: str) -> Optional[Tuple[int, Optional[str]]]:
+    """Split a `servo.<id>[.<property>]` setting path.
+
+    Uses a prefix check and a single `find` instead of `split`, as this runs
+    for every setting notification.
+
+    Args:
+        setting_path: The dot-notation path of the setting.
+
+    Returns:
+        A tuple of servo ID and property name (None when the path addresses
+        the whole servo), or None if the path is not a servo setting.
+    """
+    if not setting_path.startswith(SERVO_PATH_PREFIX):
+        return None
+    rest = setting_path[len(SERVO_PATH_PREFIX):]
+    dot = rest.find(".")
+    servo_id_str = rest if dot < 0 else rest[:dot]
+    property_name = None if dot < 0 else rest[dot + 1:]
+    servo_id = _servo_id_cache.get(servo_id_str)
+    if servo_id is None:
+        try:
+            servo_id = int(servo_id_str)
+        except ValueError:
+            return None
+        if 0 <= servo_id <= MAX_SERVO_ID:
+            # Bounded by the servo ID space, so no eviction is needed
+            _servo_id_cache[servo_id_str] = servo_id
+    return servo_id, property_name
 
 
 class ConfigHandler:
-    """Handles servo configuration storage directly in a JSON file."""
+    """Handles servo configuration storage directly in a JSON file.
+
+    Settings live in memory (`cached_settings`). Updates only mark them dirty;
+    a background thread writes the file at most once per `SAVE_DELAY`.
+    `install_process_hooks()` additionally flushes pending changes on
+    interpreter exit and on SIGTERM; `close()` stops the thread and removes
+    those hooks again.
+    """
 
     def __init__(self, node):
         """Initialize the ConfigHandler.
@@ -38,60 +92,253 @@ class ConfigHandler:
         self.node = node
         self.cached_settings = {}
         self.config_file_path = os.path.join(project_root, "config", "servo.json")
-        print(f"Using config file path: {self.config_file_path}")
+        log.info("Using config file path: %s", self.config_file_path)
+        self._lock = threading.RLock()
+        self._dirty = threading.Event()
+        self._closed = threading.Event()
+        self._hooks_installed = False
+        self._previous_sigterm = None
+        self._previous_sighup = None
+        self._on_reload: Optional[Callable[[], None]] = None
         self._load_settings()
 
+        self._save_thread = threading.Thread(target=self._save_loop, daemon=True)
+        self._save_thread.start()
+
+    def install_process_hooks(self, on_reload: Optional[Callable[[], None]] = None):
+        """Flush pending settings at exit and on SIGTERM, and reload the file on SIGHUP.
+
+        Called once by the node's `main()`; the hooks are process-wide.
+
+        Args:
+            on_reload: Called after a SIGHUP reload, e.g. to schedule
+                       `apply_to_servos` on the event loop.
+        """
+        if self._hooks_installed:
+            return
+        self._on_reload = on_reload
+        atexit.register(self.flush)
+        self._hooks_installed = True
+        try:
+            self._previous_sigterm = signal.signal(signal.SIGTERM, self._handle_sigterm)
+            if hasattr(signal, "SIGHUP"):
+                self._previous_sighup = signal.signal(signal.SIGHUP, self._handle_sighup)
+        except ValueError:
+            # Signal handlers can only be installed from the main thread
+            log.warning("Config signal handlers not installed (not on the main thread)")
+
+    def close(self):
+        """Write pending settings, stop the save thread and remove the process hooks."""
+        if self._closed.is_set():
+            return
+        with self._lock:
+            pending = self._dirty.is_set()
+            self._closed.set()
+            self._dirty.set()  # Wake the save loop so it sees the close
+        self._save_thread.join()
+        if pending:
+            self._dirty.set()
+            self.flush()
+        else:
+            self._dirty.clear()
+
+        if self._hooks_installed:
+            atexit.unregister(self.flush)
+            self._hooks_installed = False
+            self._restore_signal(signal.SIGTERM, self._handle_sigterm, self._previous_sigterm)
+            if hasattr(signal, "SIGHUP"):
+                self._restore_signal(signal.SIGHUP, self._handle_sighup, self._previous_sighup)
+
+    @staticmethod
+    def _restore_signal(signum, handler, previous):
+        """Put back the handler that was active before ours, if ours is still installed."""
+        if previous is None or signal.getsignal(signum) != handler:
+            return
+        try:
+            signal.signal(signum, previous)
+        except ValueError:
+            pass  # Not on the main thread
+
+    def _handle_sigterm(self, signum, frame):
+        """Write pending settings, then continue with the previous SIGTERM behaviour."""
+        self.flush()
+        if callable(self._previous_sigterm):
+            self._previous_sigterm(signum, frame)
+        elif self._previous_sigterm != signal.SIG_IGN:
+            raise SystemExit(128 + signum)
+
+    def _handle_sighup(self, signum, frame):
+        """Re-read the settings file and notify the `on_reload` callback."""
+        self.reload()
+        if self._on_reload is not None:
+            self._on_reload()
+
+    def _save_loop(self):
+        """Background loop writing the settings file whenever it is dirty, until closed."""
+        while not self._closed.is_set():
+            self._dirty.wait()
+            # Collect further updates into the same write; close() writes them itself
+            if self._closed.wait(SAVE_DELAY):
+                break
+            self.flush()
+
+    def flush(self):
+        """Write the settings file now if there are unsaved changes."""
+        with self._lock:
+            if not self._dirty.is_set():
+                return
+            self._dirty.clear()
+            self._save_settings()
+
     def _load_settings(self):
         """Load settings from the JSON file or create an empty one."""
         try:
-            config_dir = os.path.dirname(self.config_file_path)
-            if not os.path.exists(config_dir):
-                os.makedirs(config_dir)
-                
-            if os.path.exists(self.config_file_path):
-                with open(self.config_file_path, 'r') as f:
-                    self.cached_settings = json.load(f)
-                print(f"Loaded settings from {self.config_file_path}")
-            else:
+            os.makedirs(os.path.dirname(self.config_file_path), exist_ok=True)
+
+            try:
+                self.cached_settings = self._read_settings_file()
+                log.info("Loaded settings from %s", self.config_file_path)
+            except FileNotFoundError:
                 # Initialize with empty settings
                 self.cached_settings = {}
                 self._save_settings()
-                print(f"Created new settings file at {self.config_file_path}")
+                log.info("Created new settings file at %s", self.config_file_path)
         except Exception as e:
-            print(f"Error loading settings: {e}")
-            traceback.print_exc()
+            log.exception("Error loading settings: %s", e)
             self.cached_settings = {}
 
+    def _read_settings_file(self) -> Dict[str, Any]:
+        """Parse the settings file through a read-only memory map.
+
+        The parser reads straight from the page cache, so no user-space copy
+        of the file is made.
+
+        Returns:
+            The parsed settings dictionary.
+        """
+        with open(self.config_file_path, 'rb') as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return json_codec.loads(f.read())
+            with mapped, memoryview(mapped) as view:
+                return json_codec.loads(view)
+
+    def reload(self):
+        """Re-read the settings file, e.g. after it was edited externally.
+
+        Changes that were not yet written to disk are discarded. Only the
+        cache is refreshed; live servos pick the values up through
+        `apply_to_servos()` (done by the node on the next event after SIGHUP).
+        """
+        try:
+            settings = self._read_settings_file()
+        except Exception as e:
+            log.error("Error reloading settings from %s: %s", self.config_file_path, e)
+            return
+        with self._lock:
+            self._dirty.clear()
+            self.cached_settings = settings
+        log.info("Reloaded settings from %s", self.config_file_path)
+
+    def apply_to_servos(self, servos: Dict[int, Any]):
+        """Push the cached settings into live servos, e.g. after `reload()`.
+
+        Limits, inversion, speed and gamepad mapping take effect immediately;
+        `RELOAD_SKIPPED_SETTINGS` are left alone. The caller must rebuild the
+        control index afterwards, as `attached_control` may have changed.
+
+        Args:
+            servos: The active servos by ID.
+        """
+        for servo_id, servo in servos.items():
+            for name, value in self.get_servo_settings(servo_id).items():
+                if name not in RELOAD_SKIPPED_SETTINGS and hasattr(servo.settings, name):
+                    setattr(servo.settings, name, value)
+
     def _save_settings(self):
-        """Save the current cached settings to the JSON file."""
+        """Save the current cached settings to the JSON file.
+
+        The settings are written compactly to a temporary file, synced to
+        disk and then swapped in with `os.replace`, so a crash never leaves
+        a torn `servo.json` behind.
+        """
         try:
-            with open(self.config_file_path, 'w') as f:
-                json.dump(self.cached_settings, f, indent=2)
-            print(f"Saved settings to {self.config_file_path}")
+            with self._lock:
+                data = json_codec.dumps_bytes(self.cached_settings)
+            tmp_path = self.config_file_path + ".tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, self.config_file_path)
+            log.debug("Saved settings to %s", self.config_file_path)
         except Exception as e:
-            print(f"Error saving settings: {e}")
-            traceback.print_exc()
+            log.exception("Error saving settings: %s", e)
+
+    def update_servo_setting(self, servo_id: int, property_name: str, value: Any) -> bool:
+        """Update a specific setting for a given servo and schedule a save.
 
-    def update_servo_setting(self, servo_id: int, property_name: str, value: Any):
-        """Update a specific setting for a given servo and save to file.
+        Nothing is written if the cached value is already equal, so repeated
+        updates (e.g. a held gamepad control) cost no disk I/O.
 
         Args:
             servo_id: The ID of the servo to update.
             property_name: The name of the setting property (e.g., 'alias', 'speed').
             value: The new value for the setting.
+
+        Returns:
+            True if the setting changed, False if it already had this value.
         """
-        # Initialize servo settings if needed
         servo_id_str = str(servo_id)  # Use string keys for JSON compatibility
-        if servo_id_str not in self.cached_settings:
-            self.cached_settings[servo_id_str] = {}
-            
-        # Update the setting
-        self.cached_settings[servo_id_str][property_name] = value
-        
-        # Save to disk
-        self._save_settings()
+        with self._lock:
+            # Initialize servo settings if needed
+            bucket = self.cached_settings.setdefault(servo_id_str, {})
+            if property_name in bucket and bucket[property_name] == value:
+                return False
+
+            # Update the setting
+            bucket[property_name] = value
+
+        # Written to disk by the background save thread
+        self._dirty.set()
         
-        print(f"Updated setting: servo {servo_id}, {property_name} = {value}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Updated setting: servo %s, %s = %s", servo_id, property_name, value)
+        return True
+
+    def update_servo_properties(self, servo_id: int, properties: Dict[str, Any]) -> bool:
+        """Update several settings of one servo with a single save.
+
+        Args:
+            servo_id: The ID of the servo to update.
+            properties: Mapping of setting property names to their new values.
+
+        Returns:
+            True if any setting changed, False if all already had these values.
+        """
+        servo_id_str = str(servo_id)  # Use string keys for JSON compatibility
+        with self._lock:
+            bucket = self.cached_settings.setdefault(servo_id_str, {})
+            changed = {
+                name: value for name, value in properties.items()
+                if name not in bucket or bucket[name] != value
+            }
+            if not changed:
+                return False
+            bucket.update(changed)
+
+        # Written to disk by the background save thread
+        self._dirty.set()
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Updated settings: servo %s, %s", servo_id, ", ".join(changed))
+        return True
 
     def update_servo_settings(self, settings: ServoSettings):
         """Update all settings for a servo based on a ServoSettings object.
@@ -106,12 +353,14 @@ class ConfigHandler:
         servo_id_str = str(servo_id)
         
         # Store all settings at once
-        self.cached_settings[servo_id_str] = servo_dict
-        
-        # Save to disk
-        self._save_settings()
-        
-        print(f"Updated all settings for servo {servo_id}")
+        with self._lock:
+            if self.cached_settings.get(servo_id_str) == servo_dict:
+                return
+            self.cached_settings[servo_id_str] = servo_dict
+
+        # Written to disk by the background save thread
+        self._dirty.set()
+        log.debug("Updated all settings for servo %s", servo_id)
 
     def get_servo_settings(self, servo_id: int) -> Optional[Dict[str, Any]]:
         """Get the cached settings dictionary for a specific servo.
@@ -126,17 +375,32 @@ class ConfigHandler:
         return self.cached_settings.get(str(servo_id), {})
 
     def handle_settings_updated(self, setting_path: str, new_value: Any) -> bool:
-        """Handle a setting update notification (placeholder).
+        """Apply a setting update notification to the cached settings.
 
-        This method is intended for integration with the central config node.
-        In the current direct file-based implementation, it's a no-op.
+        Supports `servo.<id>.<property>` for a single property and
+        `servo.<id>` with a dictionary for a whole servo.
 
         Args:
             setting_path: The dot-notation path of the updated setting.
             new_value: The new value of the setting.
 
         Returns:
-            Always False in the current implementation.
+            True if the cached settings were updated, False otherwise.
         """
-        # This method is now a no-op since we're handling settings directly
-        return False
+        parsed = parse_servo_setting_path(setting_path)
+        if parsed is None:
+            return False
+
+        servo_id, property_name = parsed
+        if property_name is None:
+            if not isinstance(new_value, dict):
+                return False
+            with self._lock:
+                if self.cached_settings.get(str(servo_id)) == new_value:
+                    return True
+                self.cached_settings[str(servo_id)] = dict(new_value)
+            self._dirty.set()
+            return True
+
+        self.update_servo_setting(servo_id, property_name, new_value)
+        return True
@@ -13,6 +13,7 @@ from .tick import handle_tick, scan_for_servos
 from .settings import handle_settings
 from .setting_updated import handle_setting_updated
 from .gamepad_event import handle_gamepad_event
+from .gamepad_flush import handle_gamepad_flush, flush_pending_axis_moves
 from .detach_servo import handle_detach_servo, detach_servo
 
 __all__ = [
@@ -29,6 +30,8 @@ __all__ = [
     'handle_settings',
     'handle_setting_updated',
     'handle_gamepad_event',
+    'handle_gamepad_flush',
+    'flush_pending_axis_moves',
     'handle_detach_servo',
     'detach_servo',
 ]
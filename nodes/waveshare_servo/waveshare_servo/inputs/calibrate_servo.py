@@ -1,19 +1,13 @@
 """Handler for the 'calibrate_servo' input event."""
 
-import traceback
+import logging
 from typing import Dict, Any
-import sys
-import os
 
-# Add the parent directory to the path for imports if needed
-current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-parent_dir = os.path.dirname(os.path.dirname(current_dir))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
-
-from waveshare_servo.utils.event_processor import extract_event_data
+from waveshare_servo.utils.event_processor import extract_servo_id
 from waveshare_servo.outputs.servo_status import broadcast_servo_status
 
+log = logging.getLogger(__name__)
+
 
 def handle_calibrate_servo(context: Dict[str, Any], event: Dict[str, Any]) -> bool:
     """Handle incoming 'calibrate_servo' event.
@@ -29,14 +23,11 @@ def handle_calibrate_servo(context: Dict[str, Any], event: Dict[str, Any]) -> bo
         True if the calibration was successful, False otherwise.
     """
     try:
-        data, error = extract_event_data(event)
-        if data:
-            servo_id = data.get("id")
-            if servo_id is not None:
-                return calibrate_servo(context, servo_id)
+        servo_id = extract_servo_id(event)
+        if servo_id is not None:
+            return calibrate_servo(context, servo_id)
     except Exception as e:
-        print(f"Error processing calibrate_servo event: {e}")
-        traceback.print_exc()
+        log.exception("Error processing calibrate_servo event: %s", e)
     return False
 
 
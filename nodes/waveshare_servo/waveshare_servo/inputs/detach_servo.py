@@ -1,18 +1,13 @@
 """Handler for the 'detach_servo' input event."""
 
-import traceback
+import logging
 from typing import Dict, Any
-import sys
-import os
 
-# Add the parent directory to the path for imports if needed
-current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-parent_dir = os.path.dirname(os.path.dirname(current_dir))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
-
-from waveshare_servo.utils.event_processor import extract_event_data
+from waveshare_servo.utils.event_processor import extract_servo_id
 from waveshare_servo.outputs.servo_status import broadcast_servo_status
+from waveshare_servo.utils.control_index import unindex_servo
+
+log = logging.getLogger(__name__)
 
 
 def handle_detach_servo(context: Dict[str, Any], event: Dict[str, Any]) -> bool:
@@ -29,14 +24,11 @@ def handle_detach_servo(context: Dict[str, Any], event: Dict[str, Any]) -> bool:
         True if the servo was successfully detached, False otherwise.
     """
     try:
-        data, error = extract_event_data(event)
-        if data:
-            servo_id = data.get("id")
-            if servo_id is not None:
-                return detach_servo(context, servo_id)
+        servo_id = extract_servo_id(event)
+        if servo_id is not None:
+            return detach_servo(context, servo_id)
     except Exception as e:
-        print(f"Error processing detach_servo event: {e}")
-        traceback.print_exc()
+        log.exception("Error processing detach_servo event: %s", e)
     return False
 
 
@@ -62,14 +54,16 @@ def detach_servo(context: Dict[str, Any], servo_id: int) -> bool:
         
         print(f"Detaching servo {servo_id} from control {servo.settings.attached_control}")
         
-        # Clear the attached_control
+        # Drop it from the control index, then clear the attached_control
+        unindex_servo(context, servo)
         servo.settings.attached_control = ""
         # Clear the gamepad_config
         servo.settings.gamepad_config = {}
         
-        # Update config node for both properties
-        config.update_servo_setting(servo_id, "attached_control", "")
-        config.update_servo_setting(servo_id, "gamepad_config", {})
+        # Update config for both properties in one save
+        config.update_servo_properties(
+            servo_id, {"attached_control": "", "gamepad_config": {}}
+        )
         
         # Broadcast updated status
         broadcast_servo_status(node, servo_id, servos)
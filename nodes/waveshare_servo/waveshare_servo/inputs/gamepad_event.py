@@ -1,7 +1,113 @@
-from typing import Dict, Any, Optional
+import logging
+import time
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import pyarrow as pa
+
+from waveshare_servo.inputs.gamepad_flush import PENDING_AXIS_KEY
+from waveshare_servo.inputs.move_servo import move_servo
+from waveshare_servo.servo.axis_group import NOT_IN_GROUP, AxisGroup, shared_axis_positions
+from waveshare_servo.servo.gamepad_math import axis_absolute, axis_relative, button_toggle
+from waveshare_servo.servo.models import GamepadMapping
+from waveshare_servo.utils.control_index import CONTROL_INDEX_KEY, rebuild_control_index
+
+log = logging.getLogger(__name__)
+
+# Controls driving at least this many absolute-mode servos compute their positions with NumPy
+VECTORIZE_MIN_SERVOS = 4
+
+# Absolute-axis values closer than this to the last handled value are ignored
+AXIS_VALUE_EPSILON = 0.01
+
+# Values above this count as pressed for button-type controls
+BUTTON_THRESHOLD = 0.5
+
+# Control values within this distance of zero are treated as exactly zero
+INPUT_DEADZONE = 0.02
+
+# Axis values within this distance of zero do not move servos in relative mode
+RELATIVE_DEADZONE = 0.1
+_RELATIVE_DEADZONE_SQ = RELATIVE_DEADZONE * RELATIVE_DEADZONE
+
+# Fraction of a servo's range moved per event at full relative-mode deflection
+RELATIVE_STEP = 0.02
+
+# Minimum time between commands to one servo from an analog control (100 Hz)
+MIN_AXIS_WRITE_INTERVAL_NS = 10_000_000
+
+# Analog position changes smaller than this (in pulse units) are treated as jitter
+AXIS_DEADBAND = 2
+
+
+# --- Value Extraction ---
+
+
+def _arrow_first_value(array) -> Optional[float]:
+    """Read the first element of a PyArrow array as a float.
+
+    Gamepad events carry a single value; `to_pylist` converts that much
+    faster than going through a PyArrow scalar. Only used for non-string
+    arrays; string arrays go to `_slow_extract`. Empty arrays give None.
+    """
+    length = len(array)
+    if length == 1:
+        return float(array.to_pylist()[0])
+    return float(array[0].as_py()) if length else None
+
+
+def _slow_extract(values) -> Optional[float]:
+    """Parse the first element of a sequence from its (possibly quoted) text form.
+
+    Cold path for payloads that are not plain numbers, e.g. string arrays.
+    Empty sequences give None.
+    """
+    if not len(values):
+        return None
+    first = values[0]
+    if hasattr(first, "as_py"):
+        first = first.as_py()
+    return float(str(first).strip('"\''))
+
+
+def _parse_str(value: str) -> float:
+    """Parse a numeric string value."""
+    return float(value.strip())
+
+
+# Value extractor per event value type; plain Python types are known up front,
+# others (e.g. the various PyArrow array classes) are chosen the first time they are seen
+_EXTRACTORS: Dict[type, Callable[[Any], Optional[float]]] = {
+    float: float,
+    int: float,
+    bool: float,
+    str: _parse_str,
+}
+
+
+def _select_extractor(raw_value: Any) -> Callable[[Any], Optional[float]]:
+    """Pick the function converting values of `raw_value`'s type to a float.
+
+    PyArrow arrays (the usual dataflow payload) read their first element
+    (None if empty), plain numbers and strings are converted directly, and
+    anything else (e.g. None) reads as 0.0.
+    """
+    if isinstance(raw_value, (int, float)):
+        return float
+    if isinstance(raw_value, str):
+        return _parse_str
+    if isinstance(raw_value, pa.Array):
+        value_type = raw_value.type
+        if pa.types.is_string(value_type) or pa.types.is_large_string(value_type):
+            return _slow_extract
+        return _arrow_first_value
+    if hasattr(raw_value, "__len__") and hasattr(raw_value, "__getitem__"):
+        return _slow_extract
+    return lambda v: 0.0
+
 
 # --- Main Event Handler ---
 
+
 def handle_gamepad_event(event: Dict[str, Any], context: Dict[str, Any]) -> None:
     """
     Handle gamepad button and axis events and map them to servo movements.
@@ -11,106 +117,159 @@ def handle_gamepad_event(event: Dict[str, Any], context: Dict[str, Any]) -> None
     Args:
         event: The event data containing control name ('id') and value.
         context: The node context containing servos and other state.
-               It is assumed that a 'move_servo(context, servo_id, position)'
-               function is available or callable within this execution environment.
     """
     control_name = event.get("id")
-    raw_value = event.get("value")
-
     if control_name is None:
-        print(f"[GAMEPAD] Invalid gamepad event (no control name 'id'): {event}")
+        log.warning("[GAMEPAD] Invalid gamepad event (no control name 'id'): %s", event)
         return
 
-    # --- Robust Value Extraction ---
-    value = None
-    try:
-        # Handle PyArrow arrays (most common case from dataflow)
-        if hasattr(raw_value, "__len__") and len(raw_value) > 0:
-            item = raw_value[0]
-            if hasattr(item, "as_py"): value = item.as_py()
-            else: value = float(str(item).strip('"\'')) # Attempt conversion
-        elif isinstance(raw_value, (int, float)): value = float(raw_value)
-        elif isinstance(raw_value, str): value = float(raw_value.strip())
-        else: value = 0.0 # Default for None or unexpected types
-
-    except (ValueError, TypeError) as e:
-        print(f"[GAMEPAD] Warning: Could not convert raw value '{raw_value}' to number for control '{control_name}'. Error: {e}. Using 0.0.")
-        value = 0.0
-    except Exception as e:
-        print(f"[GAMEPAD] Error extracting value for control '{control_name}': {e}. Using 0.0.")
-        value = 0.0
+    # --- Find Mapped Servos (most controls have none) ---
+    mapped_servos = find_servos_by_control(control_name, context)
+    if not mapped_servos:
+        return
 
-    # Ensure value is float for consistency downstream
+    # --- Value Extraction (extractor cached per value type) ---
+    raw_value = event.get("value")
+    value_type = type(raw_value)
+    extract = _EXTRACTORS.get(value_type)
+    if extract is None:
+        extract = _EXTRACTORS[value_type] = _select_extractor(raw_value)
     try:
-        value = float(value)
-    except (ValueError, TypeError, OverflowError):
-        print(f"[GAMEPAD] Critical Error: Could not ensure final value is float for control '{control_name}'. Value: {value}. Aborting handling.")
+        value = extract(raw_value)
+    except (ValueError, TypeError, OverflowError) as e:
+        log.warning(
+            "[GAMEPAD] Could not convert raw value '%s' to number for control '%s'. "
+            "Error: %s. Using 0.0.", raw_value, control_name, e
+        )
+        value = 0.0
+    if value is None:
+        return  # Empty payload: no reading, not a release
+    if -INPUT_DEADZONE < value < INPUT_DEADZONE:
+        value = 0.0  # Resting sticks/triggers rarely report exactly zero
+
+    # --- Unchanged Absolute Axis: targets depend only on the value and mappings ---
+    last_axis_values = context["last_axis_values"]
+    mapping_key = AxisGroup.key_for(mapped_servos)
+    last_entry = last_axis_values.get(control_name)
+    if (
+        last_entry is not None
+        and -AXIS_VALUE_EPSILON < value - last_entry[0] < AXIS_VALUE_EPSILON
+        and last_entry[1] == mapping_key
+        and all(is_absolute_axis(servo.settings.gamepad_mapping) for servo in mapped_servos)
+    ):
         return
-
-    # --- Find Mapped Servos ---
-    mapped_servos = find_servos_by_control(control_name, context)
-    if not mapped_servos: return
+    throttled = False
+    pending_axis = context[PENDING_AXIS_KEY]
+
+    # --- Shared Axis: compute all absolute-mode positions in one pass ---
+    shared_positions = None
+    if len(mapped_servos) >= VECTORIZE_MIN_SERVOS:
+        shared_positions = shared_axis_positions(
+            context["control_axis_groups"], control_name, mapped_servos, value, VECTORIZE_MIN_SERVOS
+        )
 
     # --- Process Each Mapped Servo ---
-    for servo in mapped_servos:
+    for row, servo in enumerate(mapped_servos):
         try:
             servo_id = servo.id
-            if not hasattr(servo, 'settings') or not hasattr(servo.settings, 'gamepad_config'):
-                print(f"[GAMEPAD] Servo {servo_id} mapped to '{control_name}' but missing settings or gamepad_config.")
+            settings = servo.settings
+            mapping = settings.gamepad_mapping
+            if mapping is None:  # Empty or invalid gamepad_config
+                log.warning(
+                    "[GAMEPAD] Servo %s mapped to '%s' but has empty gamepad_config.",
+                    servo_id, control_name
+                )
                 continue
 
-            config = servo.settings.gamepad_config
-            if not config: # Check if config is not None or empty dict
-                 print(f"[GAMEPAD] Servo {servo_id} mapped to '{control_name}' but has empty gamepad_config.")
-                 continue
-
             # control_type is more about HOW the servo behaves (button/axis action)
-            # input_range (new) is about the EXPECTED VALUE RANGE from the device
-            control_type = config.get("type")
-            input_range = config.get("input_range") # NEW: Expect "unipolar" (0-1) or "bipolar" (-1 to 1)
-
-            # Calculate servo position based on mapping configuration
-            position = calculate_position(servo, value, context, control_name, control_type, input_range) # Pass input_range
-
-            if position is not None:
-                min_pulse = getattr(getattr(servo, 'settings', None), 'min_pulse', 0)
-                max_pulse = getattr(getattr(servo, 'settings', None), 'max_pulse', 1023)
-                # Ensure position is int before clamping
-                clamped_position = max(min_pulse, min(int(round(position)), max_pulse)) # Round before int conversion
-
-                current_pos = getattr(getattr(servo, 'settings', None), 'position', None)
-                if current_pos is None or clamped_position != current_pos:
-                     print(f"[GAMEPAD] Moving servo {servo_id} to position {clamped_position} (Control: '{control_name}', Value: {value:.2f}, Raw Calc: {position:.2f})")
-                     from waveshare_servo.inputs.move_servo import move_servo
-                     move_servo(context, servo_id, clamped_position)
-                     # Update context state AFTER successful move
-                     if "servos" in context and servo_id in context["servos"]:
-                        try: context["servos"][servo_id].settings.position = clamped_position
-                        except AttributeError: pass # Ignore if context structure is different
+            # input_range is about the EXPECTED VALUE RANGE from the device:
+            # "unipolar" (0-1) or "bipolar" (-1 to 1)
+            if shared_positions is not None and shared_positions[row] != NOT_IN_GROUP:
+                position = int(shared_positions[row])
+            elif mapping.direct_absolute and settings.pulse_bounds[3] > 0:
+                # Common case inlined; same result as calculate_position without the dispatch
+                position = servo.axis_position(
+                    axis_absolute(value, mapping.input_range == "bipolar", mapping.multiplier)
+                )
+            else:
+                position = calculate_position(
+                    servo, value, context, control_name, mapping.control_type, mapping.input_range
+                )
+            if position is None:
+                continue
+
+            min_pulse, max_pulse, _, _ = settings.pulse_bounds
+            clamped_position = int(round(position))  # Round before int conversion
+            if clamped_position < min_pulse:
+                clamped_position = min_pulse
+            elif clamped_position > max_pulse:
+                clamped_position = max_pulse
+
+            analog = mapping.analog
+            if analog:
+                pending_axis.pop(servo_id, None)  # Superseded by this event
+            current_pos = settings.position
+            if current_pos is not None:
+                delta = clamped_position - current_pos
+                if delta == 0:
+                    continue  # Already there
+                if (analog and mapping.mode == "absolute"
+                        and -AXIS_DEADBAND < delta < AXIS_DEADBAND):
+                    continue  # Analog jitter; relative deltas are intended steps
+            if analog:
+                # Analog controls fire far faster than the servo can follow
+                now = time.monotonic_ns()
+                if now - servo.last_axis_write_ns < MIN_AXIS_WRITE_INTERVAL_NS:
+                    # Sent by the next gamepad_flush unless a newer event replaces it
+                    pending_axis[servo_id] = clamped_position
+                    throttled = True
+                    continue
+                servo.last_axis_write_ns = now
+
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    "[GAMEPAD] Moving servo %s to position %s "
+                    "(Control: '%s', Value: %.2f, Raw Calc: %.2f)",
+                    servo_id, clamped_position, control_name, value, position
+                )
+            if move_servo(context, servo_id, clamped_position):
+                settings.position = clamped_position
 
         except AttributeError as e:
-             print(f"[GAMEPAD] Error processing servo: Missing attribute {e}. Servo data: {getattr(servo, '__dict__', 'N/A')}")
-        except ImportError:
-             print(f"[GAMEPAD] CRITICAL ERROR: Could not import 'move_servo' function.")
-             break
+            log.error(
+                "[GAMEPAD] Error processing servo %s: Missing attribute %s",
+                getattr(servo, 'id', 'UNKNOWN'), e
+            )
         except Exception as e:
-             print(f"[GAMEPAD] Unexpected error processing servo {getattr(servo, 'id', 'UNKNOWN')}: {e}")
+            log.error(
+                "[GAMEPAD] Unexpected error processing servo %s: %s",
+                getattr(servo, 'id', 'UNKNOWN'), e
+            )
 
+    # Only a value every servo has acted on may short-circuit later events,
+    # and only while the mappings and pulse bounds it was handled with stay unchanged
+    if throttled:
+        last_axis_values.pop(control_name, None)
+    else:
+        last_axis_values[control_name] = (value, mapping_key)
+
+
+def is_absolute_axis(mapping: Optional[GamepadMapping]) -> bool:
+    """Whether a mapping sets positions from the axis value alone (absolute analog mode)."""
+    return mapping is not None and mapping.analog and mapping.mode == "absolute"
 
-def find_servos_by_control(control_name: str, context: Dict[str, Any]) -> list:
-    """ Finds servos mapped to a specific control. (No changes needed here) """
-    servos = context.get("servos", {})
-    matched_servos = []
-    for servo in servos.values():
-        try:
-            if hasattr(servo, 'settings') and getattr(servo.settings, 'attached_control', None) == control_name:
-                 matched_servos.append(servo)
-        except Exception as e:
-            print(f"[GAMEPAD:FIND] Error accessing settings for a servo: {e}")
-    return matched_servos
 
+def find_servos_by_control(control_name: str, context: Dict[str, Any]) -> Sequence[Any]:
+    """Return the servos attached to a control via the control index."""
+    index = context.get(CONTROL_INDEX_KEY)
+    if index is None:
+        index = rebuild_control_index(context)
+    return index.get(control_name, ())
 
-def calculate_position(servo, value: float, context: Dict[str, Any], control_name: str, control_type: Optional[str], input_range: Optional[str]) -> Optional[float]: # Return float for precision before clamping
+
+def calculate_position(servo, value: float, context: Dict[str, Any], control_name: str,
+                       control_type: Optional[str],
+                       input_range: Optional[str]) -> Optional[float]:
     """
     Calculate servo position based on control value, configuration, and input range.
 
@@ -124,180 +283,139 @@ def calculate_position(servo, value: float, context: Dict[str, Any], control_nam
 
     Returns:
         The calculated position (float) or None.
+
+    Errors propagate to `handle_gamepad_event`, which logs them per servo.
     """
-    try:
-        config = servo.settings.gamepad_config
-        if not config: return None
-
-        mode = config.get("mode")
-        invert = config.get("invert", False)
-        multiplier = float(config.get("multiplier", 1.0))
-        is_analog_override = config.get("isAnalog", False) # If type=button, treat as analog anyway
-
-        # --- Determine Effective Input Range (Defaulting for Android target) ---
-        effective_input_range = input_range
-        if effective_input_range is None:
-             # If not specified, guess based on type, defaulting to UNIPOLAR for Android focus
-             if control_type == "axis":
-                  effective_input_range = "bipolar" # Traditional joysticks often are
-                  print(f"[GAMEPAD:CALC] Warning: 'input_range' not set for axis '{control_name}' ({servo.id}). Assuming 'bipolar' (-1 to 1). Specify if input is 'unipolar' (0 to 1).")
-             else: # button or unknown
-                  effective_input_range = "unipolar" # Safer default for triggers/buttons on Android
-                  # Only warn if it's likely being treated as analog later
-                  if mode in ["absolute", "relative"] or is_analog_override:
-                      print(f"[GAMEPAD:CALC] Warning: 'input_range' not set for control '{control_name}' ({servo.id}) acting as analog. Assuming 'unipolar' (0 to 1). Specify if input is 'bipolar' (-1 to 1).")
-
-
-        # --- Apply Inversion based on effective range ---
-        original_value = value
-        if invert:
-            if effective_input_range == "bipolar":
-                 value = -value # Flip sign for -1 to 1
-            elif effective_input_range == "unipolar":
-                 value = 1.0 - value # Map 0->1, 1->0
-            else: # Fallback guess - unipolar inversion is often safer
-                 value = 1.0 - value
-                 print(f"[GAMEPAD:CALC] Warning: Inverting with unknown input_range for {control_name} ({servo.id}). Assuming unipolar inversion (1.0 - value).")
-            # print(f"[GAMEPAD] Inverted value ({effective_input_range}) for {control_name} ({servo.id}): {original_value:.2f} -> {value:.2f}")
-
-
-        # --- Determine Handling Path ---
-        # Treat as axis if type is axis OR (type is button AND mode is absolute/relative OR isAnalog override)
-        is_handled_as_axis = (
-            control_type == "axis" or
-            (control_type == "button" and (mode in ["absolute", "relative"] or is_analog_override))
+    mapping = servo.settings.gamepad_mapping
+    if mapping is None:
+        return None
+
+    # Pre-parsed when gamepad_config was assigned
+    invert = mapping.invert
+
+    # --- Determine Effective Input Range (Defaulting for Android target) ---
+    effective_input_range = input_range
+    if effective_input_range is None:
+        # If not specified, guess based on type, defaulting to UNIPOLAR for Android focus
+        if control_type == "axis":
+            effective_input_range = "bipolar"  # Traditional joysticks often are
+            log.warning(
+                "[GAMEPAD:CALC] 'input_range' not set for axis '%s' (%s). Assuming 'bipolar' "
+                "(-1 to 1). Specify if input is 'unipolar' (0 to 1).", control_name, servo.id
+            )
+        else:  # button or unknown
+            effective_input_range = "unipolar"  # Safer default for triggers/buttons on Android
+            # Only warn if it's likely being treated as analog later
+            if mapping.analog:
+                log.warning(
+                    "[GAMEPAD:CALC] 'input_range' not set for control '%s' (%s) acting as "
+                    "analog. Assuming 'unipolar' (0 to 1). Specify if input is 'bipolar' "
+                    "(-1 to 1).", control_name, servo.id
+                )
+
+    # --- Apply Inversion based on effective range ---
+    # Bipolar flips the sign; anything else inverts as unipolar (0->1, 1->0)
+    if invert:
+        value = -value if effective_input_range == "bipolar" else 1.0 - value
+
+    # --- Dispatch on (type, mode); the isAnalog override makes a button an axis ---
+    dispatch_type = "axis" if mapping.is_analog and control_type == "button" else control_type
+    handler = _DISPATCH.get((dispatch_type, mapping.mode))
+    if handler is not None:
+        return handler(servo, value, mapping, context, effective_input_range)
+    if mapping.analog:
+        log.warning("[GAMEPAD:AXIS] Unknown axis mode '%s' for servo %s", mapping.mode, servo.id)
+    elif control_type == "button":
+        log.warning(
+            "[GAMEPAD:BUTTON] Unknown button mode '%s' for servo %s", mapping.mode, servo.id
+        )
+    else:
+        log.warning(
+            "[GAMEPAD] Unknown control type '%s' for control '%s' (%s).",
+            control_type, control_name, servo.id
         )
+    return None
 
-        if is_handled_as_axis:
-            # print(f"[GAMEPAD] Handling '{control_name}' ({servo.id}) as ANALOG (Mode: {mode}, Input: {effective_input_range})")
-            # Pass the *determined* effective_input_range for correct processing
-            return handle_axis_control(servo, value, mode, multiplier, context, effective_input_range)
-        elif control_type == "button":
-            # print(f"[GAMEPAD] Handling '{control_name}' ({servo.id}) as BUTTON (Mode: {mode})")
-            # Button handler expects 0/1 logic, value should be raw (but possibly inverted)
-            return handle_button_control(servo, value, mode, context)
-        else:
-            print(f"[GAMEPAD] Unknown control type '{control_type}' for control '{control_name}' ({servo.id}).")
-            return None
-
-    except AttributeError as e:
-        print(f"[GAMEPAD:CALC] Error accessing servo attributes for {getattr(servo, 'id', 'UNKNOWN')}: {e}")
-        return None
-    except Exception as e:
-        print(f"[GAMEPAD:CALC] Error calculating position for {getattr(servo, 'id', 'UNKNOWN')}: {e}")
-        return None
 
+def _dispatch_axis(servo, value: float, mapping: GamepadMapping, context: Dict[str, Any],
+                   input_range: str) -> Optional[float]:
+    """`_DISPATCH` entry for analog modes."""
+    return handle_axis_control(servo, value, mapping.mode, mapping.multiplier, context, input_range)
 
-def handle_button_control(servo, value: float, mode: Optional[str], context: Dict[str, Any]) -> Optional[int]:
-    """ Handle button-type controls (toggle or momentary). Assumes 0/1 logic via threshold. """
-    try:
-        # Use a threshold suitable for 0-1 inputs (analog triggers acting as buttons)
-        # and also works for digital 0/1 inputs.
-        threshold = 0.5
-        is_pressed = value > threshold
-        button_state = 1 if is_pressed else 0
-
-        # State tracking remains the same
-        button_states = context.setdefault("gamepad_button_states", {})
-        servo_id = servo.id
-        state_key = f"{servo_id}"
-        prev_state = button_states.get(state_key, 0)
-
-        new_position = None
-        min_pulse = servo.settings.min_pulse
-        max_pulse = servo.settings.max_pulse
-
-        if mode == "toggle":
-            if button_state == 1 and prev_state == 0: # Trigger on press edge
-                current_pos = servo.settings.position # Assumes position is reliably updated
-                middle_point = min_pulse + (max_pulse - min_pulse) / 2.0
-                new_position = min_pulse if current_pos > middle_point else max_pulse
-        elif mode == "momentary":
-             new_position = max_pulse if button_state == 1 else min_pulse
-        else:
-            print(f"[GAMEPAD:BUTTON] Unknown button mode '{mode}' for servo {servo_id}")
-
-        button_states[state_key] = button_state
-        return new_position # Return int as button modes usually target endpoints
-
-    except AttributeError as e:
-        print(f"[GAMEPAD:BUTTON] Error accessing servo attributes for {getattr(servo, 'id', 'UNKNOWN')}: {e}")
-        return None
-    except Exception as e:
-        print(f"[GAMEPAD:BUTTON] Error handling button control for {getattr(servo, 'id', 'UNKNOWN')}: {e}")
+
+def _dispatch_button(servo, value: float, mapping: GamepadMapping, context: Dict[str, Any],
+                     input_range: str) -> Optional[int]:
+    """`_DISPATCH` entry for button modes; the handler expects 0/1 logic (possibly inverted)."""
+    return handle_button_control(servo, value, mapping.mode, context)
+
+
+def handle_button_control(servo, value: float, mode: Optional[str],
+                          context: Dict[str, Any]) -> Optional[int]:
+    """ Handle button-type controls (toggle or momentary). Assumes 0/1 logic via threshold.
+
+    Errors propagate to `handle_gamepad_event`, which logs them.
+    """
+    # Threshold suits 0-1 inputs (analog triggers acting as buttons) as well as digital 0/1 inputs
+    button_state = 1 if value > BUTTON_THRESHOLD else 0
+    prev_state = servo.button_state
+    servo.button_state = button_state
+
+    min_pulse, max_pulse, middle_point, _ = servo.settings.pulse_bounds
+    if mode == "toggle":
+        if button_state == 1 and prev_state == 0:  # Trigger on press edge
+            # Assumes position is reliably updated
+            return button_toggle(servo.settings.position, min_pulse, max_pulse, middle_point)
         return None
+    if mode == "momentary":
+        return max_pulse if button_state == 1 else min_pulse
+    log.warning("[GAMEPAD:BUTTON] Unknown button mode '%s' for servo %s", mode, servo.id)
+    return None
 
 
-def handle_axis_control(servo, value: float, mode: Optional[str], multiplier: float, context: Dict[str, Any], input_range: str) -> Optional[float]: # Return float
+def handle_axis_control(servo, value: float, mode: Optional[str], multiplier: float,
+                        context: Dict[str, Any], input_range: str) -> Optional[float]:
     """
     Handle axis-type controls (absolute or relative) respecting the input_range.
+
+    Errors propagate to `handle_gamepad_event`, which logs them.
     """
-    try:
-        min_pulse = float(servo.settings.min_pulse) # Ensure float for calculations
-        max_pulse = float(servo.settings.max_pulse)
-        servo_range = max_pulse - min_pulse
-        if servo_range <= 0: return None # Invalid range
-
-        new_position = None
-
-        if mode == "absolute":
-            normalized_value = 0.0 # Target range [0.0, 1.0]
-
-            if input_range == "bipolar":
-                 # Input: -1.0 to 1.0
-                 clamped_value = max(-1.0, min(value, 1.0))
-                 normalized_value = (clamped_value + 1.0) / 2.0 # Map [-1, 1] -> [0, 1]
-                 # print(f"[GAMEPAD:AXIS] Absolute (Bipolar): Servo {servo.id}, Val={value:.2f} -> Norm={normalized_value:.2f}")
-            elif input_range == "unipolar":
-                 # Input: 0.0 to 1.0 (like Android trigger)
-                 clamped_value = max(0.0, min(value, 1.0))
-                 normalized_value = clamped_value # Already in [0, 1] range
-                 # print(f"[GAMEPAD:AXIS] Absolute (Unipolar): Servo {servo.id}, Val={value:.2f} -> Norm={normalized_value:.2f}")
-            else: # Should not happen if calculate_position sets a default
-                 print(f"[GAMEPAD:AXIS] Error: Reached absolute mode with unknown input_range '{input_range}' for {servo.id}")
-                 return None
-
-            # Apply multiplier for sensitivity/scaling within the [0, 1] space
-            center_point = 0.5
-            effective_value = center_point + (normalized_value - center_point) * multiplier
-            final_scaled_value = max(0.0, min(effective_value, 1.0))
-
-            new_position = min_pulse + (final_scaled_value * servo_range)
-            # print(f"[GAMEPAD:AXIS] Absolute Output: Servo {servo.id} -> Scaled={final_scaled_value:.2f} -> Pos={new_position:.1f}")
-
-
-        elif mode == "relative":
-            deadzone = 0.1
-            if abs(value) > deadzone:
-                # Determine rate based on input range
-                relative_rate = 0.0
-                if input_range == "bipolar":
-                    # Expects -1 to 1 for direction/speed
-                    relative_rate = max(-1.0, min(value, 1.0))
-                elif input_range == "unipolar":
-                    # Expects 0 to 1 for speed (direction comes from invert/multiplier sign)
-                    # Assume 0 is stop, 1 is max rate *in the configured direction*
-                    relative_rate = max(0.0, min(value, 1.0))
-                    # If multiplier is negative, rate effectively becomes negative for change calc
-                else: return None # Should not happen
-
-                base_step_per_event = servo_range * 0.02 # % step per event
-                change = relative_rate * multiplier * base_step_per_event
-
-                current_pos = float(servo.settings.position) # Need reliable current pos
-                target_pos = current_pos + change
-                new_position = max(min_pulse, min(target_pos, max_pulse)) # Clamp result
-                # print(f"[GAMEPAD:AXIS] Relative ({input_range}): Servo {servo.id}, Val={value:.2f}, Rate={relative_rate:.2f}, Change={change:.1f}, New={new_position:.1f}")
-            # else: stay at current position (new_position remains None implicitly if not set)
-
-        else:
-            print(f"[GAMEPAD:AXIS] Unknown axis mode '{mode}' for servo {servo.id}")
-
-        return new_position # Return float
-
-    except AttributeError as e:
-        print(f"[GAMEPAD:AXIS] Error accessing servo attributes for {getattr(servo, 'id', 'UNKNOWN')}: {e}")
+    settings = servo.settings
+    min_pulse, max_pulse, _, span = settings.pulse_bounds
+    if span <= 0:
+        return None  # Invalid range
+
+    # Should not happen, calculate_position sets a default
+    if input_range not in ("bipolar", "unipolar"):
+        log.error(
+            "[GAMEPAD:AXIS] Reached %s mode with unknown input_range '%s' for %s",
+            mode, input_range, servo.id
+        )
         return None
-    except Exception as e:
-        print(f"[GAMEPAD:AXIS] Error handling axis control for {getattr(servo, 'id', 'UNKNOWN')}: {e}")
-        return None
\ No newline at end of file
+    bipolar = input_range == "bipolar"
+
+    if mode == "absolute":
+        # Bipolar is -1..1, unipolar (e.g. Android trigger) 0..1;
+        # the multiplier scales around the center
+        return servo.axis_position(axis_absolute(value, bipolar, multiplier))
+
+    if mode == "relative":
+        if value * value <= _RELATIVE_DEADZONE_SQ:
+            return None  # Inside the deadzone: stay at current position
+        return axis_relative(
+            value, bipolar, multiplier * span * RELATIVE_STEP,
+            settings.position, min_pulse, max_pulse
+        )
+
+    log.warning("[GAMEPAD:AXIS] Unknown axis mode '%s' for servo %s", mode, servo.id)
+    return None
+
+
+# Position handler by (control type, mode); buttons in absolute/relative mode act as analog
+_DISPATCH = {
+    ("axis", "absolute"): _dispatch_axis,
+    ("axis", "relative"): _dispatch_axis,
+    ("button", "absolute"): _dispatch_axis,
+    ("button", "relative"): _dispatch_axis,
+    ("button", "toggle"): _dispatch_button,
+    ("button", "momentary"): _dispatch_button,
+}
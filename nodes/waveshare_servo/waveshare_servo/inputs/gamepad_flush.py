@@ -0,0 +1,56 @@
+"""Handler for the 'gamepad_flush' input event."""
+
+import logging
+import time
+from typing import Any, Dict
+
+from waveshare_servo.inputs.move_servo import move_servo
+
+log = logging.getLogger(__name__)
+
+# Context key holding the latest rate-limited axis target per servo ID
+PENDING_AXIS_KEY = "pending_axis_positions"
+
+
+def handle_gamepad_flush(context: Dict[str, Any], event: Dict[str, Any]) -> bool:
+    """Handle the periodic 'gamepad_flush' timer event.
+
+    Analog controls can report far faster than the servo bus accepts
+    commands, so `handle_gamepad_event` keeps only the latest target of a
+    rate-limited servo. This sends those targets, so a servo still reaches
+    where the stick stopped even if no further events arrive.
+
+    Args:
+        context: The node context dictionary.
+        event: The Dora timer event (unused).
+
+    Returns:
+        True if the pending moves were processed, False on error.
+    """
+    try:
+        flush_pending_axis_moves(context)
+        return True
+    except Exception as e:
+        log.exception("Error processing gamepad_flush event: %s", e)
+        return False
+
+
+def flush_pending_axis_moves(context: Dict[str, Any]):
+    """Move every servo with a pending axis target and clear the targets.
+
+    Args:
+        context: The node context dictionary.
+    """
+    pending = context[PENDING_AXIS_KEY]
+    if not pending:
+        return
+    servos = context["servos"]
+    now = time.monotonic_ns()
+    while pending:
+        servo_id, position = pending.popitem()
+        servo = servos.get(servo_id)
+        if servo is None:
+            continue # Detached since the target was recorded
+        servo.last_axis_write_ns = now
+        if move_servo(context, servo_id, position):
+            servo.settings.position = position
@@ -1,19 +1,13 @@
 """Handler for the 'move_servo' input event."""
 
-import traceback
+import logging
 from typing import Dict, Any
-import sys
-import os
-
-# Add the parent directory to the path for imports if needed
-current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-parent_dir = os.path.dirname(os.path.dirname(current_dir))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
 
 from waveshare_servo.utils.event_processor import extract_event_data
 from waveshare_servo.outputs.servo_status import broadcast_servo_status
 
+log = logging.getLogger(__name__)
+
 
 def handle_move_servo(context: Dict[str, Any], event: Dict[str, Any]) -> bool:
     """Handle incoming 'move_servo' event.
@@ -36,31 +30,67 @@ def handle_move_servo(context: Dict[str, Any], event: Dict[str, Any]) -> bool:
             if servo_id is not None and position is not None:
                 return move_servo(context, servo_id, position)
     except Exception as e:
-        print(f"Error processing move_servo event: {e}")
-        traceback.print_exc()
+        log.exception("Error processing move_servo event: %s", e)
     return False
 
 
 def move_servo(context: Dict[str, Any], servo_id: int, position: int) -> bool:
     """Move a specific servo to the target position.
 
+    When the context provides a `serial_worker`, the move is queued on it and
+    the settings, config and status broadcast are updated optimistically so
+    the event loop does not wait for the serial round trip. If the queued
+    move fails, the previous position is restored.
+
     Args:
         context: The node context dictionary.
         servo_id: The ID of the servo to move.
         position: The target position for the servo.
 
     Returns:
-        True if the move command was successful, False otherwise.
+        True if the move command was sent (or queued), False otherwise.
     """
     node = context["node"]
     config = context["config"]
     servos = context["servos"]
-    
+    worker = context.get("serial_worker")
+
     if servo_id in servos:
         servo = servos[servo_id]
-        if servo.move(position):
-            # Update position in config
-            config.update_servo_setting(servo_id, "position", position)
-            broadcast_servo_status(node, servo_id, servos)
-            return True
+        # settings.position holds the logical (uninverted) target, never the physical one
+        if worker is not None:
+            previous = servo.settings.position
+            servo.settings.position = position
+            worker.submit(servo.move, position).add_done_callback(
+                lambda future: _handle_queued_move(future, context, servo, position, previous)
+            )
+        elif servo.move(position):
+            servo.settings.position = position
+        else:
+            return False
+
+        # Update position in config
+        config.update_servo_setting(servo_id, "position", position)
+        broadcast_servo_status(node, servo_id, servos)
+        return True
     return False
+
+
+def _handle_queued_move(future, context: Dict[str, Any], servo, position: int, previous: int):
+    """Log a queued move that did not succeed and roll back its position.
+
+    Runs on the serial worker thread. The rollback is skipped if a newer
+    move has already replaced the optimistic position.
+    """
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        log.warning("Error moving servo %s to %s: %s", servo.id, position, error)
+    elif not future.result():
+        log.warning("Failed to move servo %s to %s", servo.id, position)
+    else:
+        return
+    if servo.settings.position == position:
+        servo.settings.position = previous
+        context["config"].update_servo_setting(servo.id, "position", previous)
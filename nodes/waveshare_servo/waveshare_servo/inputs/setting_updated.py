@@ -1,17 +1,13 @@
 """Handler for the 'setting_updated' input event."""
 
-import traceback
+import logging
 from typing import Dict, Any
-import sys
-import os
-
-# Add the parent directory to the path for imports if needed
-current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-parent_dir = os.path.dirname(os.path.dirname(current_dir))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
 
 from waveshare_servo.utils.event_processor import extract_event_data
+from waveshare_servo.config.handler import parse_servo_setting_path
+from waveshare_servo.utils.control_index import index_servo
+
+log = logging.getLogger(__name__)
 
 
 def handle_setting_updated(context: Dict[str, Any], event: Dict[str, Any]) -> bool:
@@ -42,26 +38,24 @@ def handle_setting_updated(context: Dict[str, Any], event: Dict[str, Any]) -> bo
                 config.handle_settings_updated(path, value)
                 
                 # Check if this is a servo setting that needs to be applied
-                parts = path.split(".")
-                if len(parts) >= 3 and parts[0] == "servo":
-                    try:
-                        servo_id = int(parts[1])
-                        property_name = parts[2]
-                        
-                        # Apply the setting if the servo exists
-                        if servo_id in servos and hasattr(
-                            servos[servo_id].settings, property_name
-                        ):
-                            setattr(
-                                servos[servo_id].settings, property_name, value
-                            )
-                            
-                            # If this is a position update, actually move the servo
-                            if property_name == "position":
-                                servos[servo_id].move(value)
-                    except (ValueError, IndexError):
-                        pass
+                parsed = parse_servo_setting_path(path)
+                if parsed and parsed[1]:
+                    servo_id, property_name = parsed
+
+                    # Apply the setting if the servo exists
+                    if servo_id in servos and hasattr(
+                        servos[servo_id].settings, property_name
+                    ):
+                        setattr(
+                            servos[servo_id].settings, property_name, value
+                        )
+
+                        # If this is a position update, actually move the servo
+                        if property_name == "position":
+                            servos[servo_id].move(value)
+                        elif property_name == "attached_control":
+                            index_servo(context, servos[servo_id])
             return True
     except Exception as e:
-        print(f"Error processing setting_updated event: {e}")
+        log.exception("Error processing setting_updated event: %s", e)
     return False
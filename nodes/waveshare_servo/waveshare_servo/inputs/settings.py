@@ -1,18 +1,12 @@
 """Handler for the 'settings' input event (full configuration broadcast)."""
 
-import traceback
+import logging
 from typing import Dict, Any
-import sys
-import os
-
-# Add the parent directory to the path for imports if needed
-current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-parent_dir = os.path.dirname(os.path.dirname(current_dir))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
 
 from waveshare_servo.utils.event_processor import extract_event_data
 
+log = logging.getLogger(__name__)
+
 
 def handle_settings(context: Dict[str, Any], event: Dict[str, Any]) -> bool:
     """Handle the 'settings' input event.
@@ -51,5 +45,5 @@ def handle_settings(context: Dict[str, Any], event: Dict[str, Any]) -> bool:
                             continue
             return True
     except Exception as e:
-        print(f"Error processing settings event: {e}")
+        log.exception("Error processing settings event: %s", e)
     return False
@@ -2,22 +2,16 @@
 Handler for tick events.
 """
 
-import traceback
+import logging
 from typing import Dict, Any
-import sys
-import os
-
-# Add the parent directory to the path for imports if needed
-# (Assuming these imports are correct for your project structure)
-current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-parent_dir = os.path.dirname(os.path.dirname(current_dir))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
 
 from waveshare_servo.servo.models import ServoSettings
 from waveshare_servo.servo.controller import Servo
 from waveshare_servo.outputs.servo_status import broadcast_servo_status
 from waveshare_servo.outputs.servos_list import broadcast_servos_list
+from waveshare_servo.utils.control_index import rebuild_control_index
+
+log = logging.getLogger(__name__)
 
 
 def handle_tick(context, event: Dict[str, Any]) -> bool:
@@ -26,9 +20,7 @@ def handle_tick(context, event: Dict[str, Any]) -> bool:
         scan_for_servos(context)
         return True
     except Exception as e:
-        # Use traceback for more detailed error logging
-        print(f"Error processing tick event: {e}")
-        traceback.print_exc()
+        log.exception("Error processing tick event: %s", e)
         return False
 
 
@@ -126,8 +118,7 @@ def scan_for_servos(context):
                             # Don't add this servo, don't save config for it
                             continue # Move to the next discovered_id
                     except Exception as id_set_error:
-                         print(f"ERROR: Exception during set_id for servo 1 to {new_id}: {id_set_error}")
-                         traceback.print_exc()
+                         log.exception("Exception during set_id for servo 1 to %s: %s", new_id, id_set_error)
                          # Don't add this servo
                          continue # Move to the next discovered_id
                 # --- End Handle Default ID Assignment ---
@@ -180,9 +171,10 @@ def scan_for_servos(context):
         # --- Broadcast the final list of *currently responsive* servos ---
         # Only log when there's a change in servo list
         if set(servos.keys()) != previously_known_servos:
+            # Servos came or went: the control index must follow
+            rebuild_control_index(context)
             print(f"Broadcasting updated servos list: {list(servos.keys())}")
         broadcast_servos_list(node, servos)
 
     except Exception as e:
-        print(f"Error during scan_for_servos: {e}")
-        traceback.print_exc()
\ No newline at end of file
+        log.exception("Error during scan_for_servos: %s", e)
\ No newline at end of file
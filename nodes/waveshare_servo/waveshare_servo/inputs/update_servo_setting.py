@@ -2,19 +2,14 @@
 Handler for update_servo_setting events.
 """
 
-import traceback
+import logging
 from typing import Dict, Any
-import sys
-import os
-
-# Add the parent directory to the path for imports if needed
-current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-parent_dir = os.path.dirname(os.path.dirname(current_dir))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
 
 from waveshare_servo.utils.event_processor import extract_event_data
 from waveshare_servo.outputs.servo_status import broadcast_servo_status
+from waveshare_servo.utils.control_index import index_servo
+
+log = logging.getLogger(__name__)
 
 
 def handle_update_servo_setting(context, event: Dict[str, Any]) -> bool:
@@ -30,8 +25,7 @@ def handle_update_servo_setting(context, event: Dict[str, Any]) -> bool:
             if all(x is not None for x in [servo_id, property_name, value]):
                 return update_servo_setting(context, servo_id, property_name, value)
     except Exception as e:
-        print(f"Error processing update_servo_setting event: {e}")
-        traceback.print_exc()
+        log.exception("Error processing update_servo_setting event: %s", e)
     return False
 
 
@@ -65,6 +59,8 @@ def update_servo_setting(context, servo_id: int, property_name: str, value: any)
                 current_pos = servo.settings.position
                 inverted_pos = servo.settings.max_pulse - (current_pos - servo.settings.min_pulse)
                 servo.settings.position = inverted_pos
+            elif property_name == "attached_control":
+                index_servo(context, servo)
             
             # Update config node
             config.update_servo_setting(servo_id, property_name, value)
@@ -1,17 +1,11 @@
 """Handler for the 'wiggle_servo' input event."""
 
-import traceback
+import logging
 from typing import Dict, Any
-import sys
-import os
 
-# Add the parent directory to the path for imports if needed
-current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-parent_dir = os.path.dirname(os.path.dirname(current_dir))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
+from waveshare_servo.utils.event_processor import extract_servo_id
 
-from waveshare_servo.utils.event_processor import extract_event_data
+log = logging.getLogger(__name__)
 
 
 def handle_wiggle_servo(context: Dict[str, Any], event: Dict[str, Any]) -> bool:
@@ -28,14 +22,11 @@ def handle_wiggle_servo(context: Dict[str, Any], event: Dict[str, Any]) -> bool:
         True if the wiggle action was successful, False otherwise.
     """
     try:
-        data, error = extract_event_data(event)
-        if data:
-            servo_id = data.get("id")
-            if servo_id is not None:
-                return wiggle_servo(context, servo_id)
+        servo_id = extract_servo_id(event)
+        if servo_id is not None:
+            return wiggle_servo(context, servo_id)
     except Exception as e:
-        print(f"Error processing wiggle_servo event: {e}")
-        traceback.print_exc()
+        log.exception("Error processing wiggle_servo event: %s", e)
     return False
 
 
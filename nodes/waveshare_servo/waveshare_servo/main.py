@@ -8,10 +8,9 @@ This node handles all servo-related operations:
 - Servo settings management via the config node
 """
 
-import traceback
+import logging
 import sys
 import os
-from typing import Dict
 
 from dora import Node
 
@@ -19,6 +18,9 @@ from dora import Node
 from waveshare_servo.servo.controller import Servo
 from waveshare_servo.servo.scanner import ServoScanner
 from waveshare_servo.config.handler import ConfigHandler
+from waveshare_servo.utils.control_index import rebuild_control_index
+from waveshare_servo.utils.serial_worker import SerialWorker
+from waveshare_servo.utils.logging_setup import configure_logging
 from waveshare_servo.inputs import (
     handle_move_servo, 
     handle_wiggle_servo, 
@@ -27,27 +29,50 @@ from waveshare_servo.inputs import (
     handle_tick, 
     handle_settings,
     handle_setting_updated,
+    handle_detach_servo,
+    handle_gamepad_event,
+    handle_gamepad_flush,
     scan_for_servos
 )
 
+log = logging.getLogger(__name__)
 
-def process_event(event, node, scanner, config, servos, next_available_id):
-    """Process an incoming event."""
+
+# Events whose handlers only queue work on the serial worker
+ASYNC_EVENTS = ("move_servo", "gamepad_flush")
+
+# Input ID prefix of gamepad control events
+GAMEPAD_PREFIX = "GAMEPAD_"
+
+# Context flag set by the SIGHUP hook; the reloaded settings are applied to
+# the live servos at the start of the next event, on the event-loop thread
+CONFIG_RELOADED_KEY = "config_reloaded"
+
+
+def process_event(event, context):
+    """Process an incoming event.
+
+    Args:
+        event: The Dora event.
+        context: The node context dictionary, shared by all events so that
+                 state kept in it (e.g. the control index) persists.
+    """
     try:
         if event["type"] != "INPUT":
-            return next_available_id
+            return
             
+        if context.pop(CONFIG_RELOADED_KEY, False):
+            context["config"].apply_to_servos(context["servos"])
+            rebuild_control_index(context)
+
         event_id = event["id"]
+        scanner = context["scanner"]
+        serial_worker = context.get("serial_worker")
         
-        # Build context for handlers
-        context = {
-            "node": node,
-            "scanner": scanner, 
-            "config": config,
-            "servos": servos,
-            "next_available_id": next_available_id
-        }
-        
+        # Handlers that use the bus directly must not interleave with queued moves
+        if serial_worker is not None and event_id not in ASYNC_EVENTS and not event_id.startswith(GAMEPAD_PREFIX):
+            serial_worker.wait_idle()
+
         # Map event IDs to handler functions
         handlers = {
             "move_servo": lambda evt: handle_move_servo(context, evt),
@@ -56,6 +81,7 @@ def process_event(event, node, scanner, config, servos, next_available_id):
             "update_servo_setting": lambda evt: handle_update_servo_setting(context, evt),
             "detach_servo": lambda evt: handle_detach_servo(context, evt),
             "tick": lambda evt: handle_tick(context, evt),
+            "gamepad_flush": lambda evt: handle_gamepad_flush(context, evt),
             # We no longer need these handlers as we're handling settings directly
             # "settings": lambda evt: handle_settings(context, evt),
             # "setting_updated": lambda evt: handle_setting_updated(context, evt)
@@ -65,62 +91,68 @@ def process_event(event, node, scanner, config, servos, next_available_id):
         if event_id in handlers:
             handlers[event_id](event)
         # Check for gamepad events (prefixed with GAMEPAD_)
-        elif event_id.startswith("GAMEPAD_"):
-            # Strip the prefix for internal processing
-            event_data = event.copy()
-            event_data["id"] = event_id.replace("GAMEPAD_", "")
-            from waveshare_servo.inputs.gamepad_event import handle_gamepad_event
-            handle_gamepad_event(event_data, context)
-        
-        # Return potentially updated next_available_id
-        return context["next_available_id"]
+        elif event_id.startswith(GAMEPAD_PREFIX):
+            # Strip the prefix for internal processing; the handler only reads id and value
+            handle_gamepad_event(
+                {"id": event_id[len(GAMEPAD_PREFIX):], "value": event.get("value")}, context
+            )
+
+        # Event-loop boundary: send any command frames still being coalesced
+        writer = scanner.writer
+        if writer is not None and writer.pending:
+            if serial_worker is not None:
+                serial_worker.submit(writer.flush)
+            else:
+                writer.flush()
         
     except Exception as e:
-        print(f"Error processing event {event.get('id', 'unknown')}: {e}")
-        traceback.print_exc()
-        return next_available_id
+        log.exception("Error processing event %s: %s", event.get('id', 'unknown'), e)
 
 
 def main():
     """Entry point for the node."""
+    configure_logging()
     try:
         node = Node()
-        print("Waveshare Servo Node starting...")
+        log.info("Waveshare Servo Node starting...")
         
         # Initialize components
         scanner = ServoScanner()
         config = ConfigHandler(node)
-        servos = {}
-        next_available_id = 2  # Reserved IDs start from 2
+        context = {
+            "node": node,
+            "scanner": scanner, 
+            "config": config,
+            "servos": {},
+            "next_available_id": 2,  # Reserved IDs start from 2
+            "serial_worker": SerialWorker(),
+            # Gamepad caches, created up front so handlers index them directly
+            "control_axis_groups": {},
+            "last_axis_values": {},
+            "pending_axis_positions": {},
+        }
+
+        def schedule_settings_apply():
+            context[CONFIG_RELOADED_KEY] = True
+
+        config.install_process_hooks(on_reload=schedule_settings_apply)
         
         # Initial connection and scanning
         if scanner.connect():
-            context = {
-                "node": node,
-                "scanner": scanner, 
-                "config": config,
-                "servos": servos,
-                "next_available_id": next_available_id
-            }
             scan_for_servos(context)
-            next_available_id = context["next_available_id"]
         else:
-            print("Failed to connect to servo controller - will retry on next tick")
+            log.warning("Failed to connect to servo controller - will retry on next tick")
         
-        print("Starting main event loop...")
+        log.info("Starting main event loop...")
         # Main event loop
         for event in node:
             try:
                 # Process incoming events
-                next_available_id = process_event(
-                    event, node, scanner, config, servos, next_available_id
-                )
+                process_event(event, context)
             except Exception as e:
-                print(f"Unexpected error in event loop: {e}")
-                traceback.print_exc()
+                log.exception("Unexpected error in event loop: %s", e)
     except Exception as e:
-        print(f"Error starting waveshare_servo node: {e}")
-        traceback.print_exc()
+        log.exception("Error starting waveshare_servo node: %s", e)
         # Don't re-raise exception so the process exits gracefully
 
 
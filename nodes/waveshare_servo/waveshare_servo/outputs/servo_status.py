@@ -1,19 +1,13 @@
 """Broadcaster function for servo status updates."""
 
-import json
-import traceback
-import sys
-import os
+import logging
 import pyarrow as pa
 from typing import Dict
 
-# Add the parent directory to the path for imports if needed
-current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-parent_dir = os.path.dirname(os.path.dirname(current_dir))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
-
 from waveshare_servo.servo.controller import Servo
+from waveshare_servo.utils import json_codec
+
+log = logging.getLogger(__name__)
 
 
 def broadcast_servo_status(node, servo_id: int, servos: Dict[int, Servo]):
@@ -32,8 +26,7 @@ def broadcast_servo_status(node, servo_id: int, servos: Dict[int, Servo]):
             servo = servos[servo_id]
             node.send_output(
                 "servo_status",
-                pa.array([json.dumps(servo.settings.to_dict())])
+                pa.array([json_codec.dumps(servo.settings.to_dict())])
             )
     except Exception as e:
-        print(f"Error broadcasting servo status: {e}")
-        traceback.print_exc()
+        log.exception("Error broadcasting servo status: %s", e)
@@ -1,12 +1,14 @@
 """Broadcaster for the list of discovered servos."""
 
-import json
-import traceback
+import logging
 import pyarrow as pa
 from typing import Dict
 
 # Assuming editable install handles path correctly
 from waveshare_servo.servo.controller import Servo
+from waveshare_servo.utils import json_codec
+
+log = logging.getLogger(__name__)
 
 
 def broadcast_servos_list(node, servos: Dict[int, Servo]):
@@ -42,9 +44,8 @@ def broadcast_servos_list(node, servos: Dict[int, Servo]):
         # Only send servos that responded to ping, in sorted order
         node.send_output(
             "servos_list", 
-            pa.array([json.dumps(sorted_servos)])
+            pa.array([json_codec.dumps(sorted_servos)])
         )
-        print(f"Broadcasting {len(sorted_servos)} found servos out of {len(servos)} configured")
+        log.debug("Broadcasting %d found servos out of %d configured", len(sorted_servos), len(servos))
     except Exception as e:
-        print(f"Error broadcasting servos list: {e}")
-        traceback.print_exc()
+        log.exception("Error broadcasting servos list: %s", e)
@@ -4,7 +4,7 @@ Servo module for the Waveshare Servo Node.
 
 from .controller import Servo
 from .scanner import ServoScanner
-from .models import ServoSettings
+from .models import ServoSettings, GamepadMapping
 from .wiggle import wiggle_servo
 from .calibrate import calibrate_servo
 from .port_finder import find_servo_port
@@ -29,6 +29,7 @@ __all__ = [
     'Servo',
     'ServoScanner',
     'ServoSettings',
+    'GamepadMapping',
     'wiggle_servo',
     'calibrate_servo',
     'find_servo_port',
@@ -0,0 +1,115 @@
+"""Vectorized absolute-axis mapping for servos sharing one gamepad control."""
+
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+# Marks servos in the group's result whose position is not computed here
+NOT_IN_GROUP = -1
+
+
+class AxisGroup:
+    """Absolute-mode servos of one control, held as parallel NumPy arrays.
+
+    When one axis drives several servos (e.g. mirrored arms), their
+    positions are computed for all of them in one pass instead of once per
+    servo. Servos on the control that are not in absolute axis mode are
+    left to the per-servo path.
+
+    Attributes:
+        key: The servos, mappings and pulse bounds the arrays were built
+             from; compare with `AxisGroup.key_for` to detect changes.
+        count: Number of servos whose positions the group computes.
+    """
+
+    def __init__(self, servos: Sequence[Any]):
+        """Build the arrays for the servos attached to one control.
+
+        Args:
+            servos: All servos attached to the control, in lookup order.
+        """
+        self.key = self.key_for(servos)
+        rows, bipolar, invert, multiplier, min_pulse, span = [], [], [], [], [], []
+        for row, servo in enumerate(servos):
+            mapping = servo.settings.gamepad_mapping
+            if mapping is None or mapping.mode != "absolute":
+                continue
+            if mapping.control_type not in ("axis", "button"):
+                continue
+            bounds = servo.settings.pulse_bounds
+            if bounds[3] <= 0:
+                continue
+            input_range = mapping.input_range or (
+                "bipolar" if mapping.control_type == "axis" else "unipolar"
+            )
+            if input_range not in ("bipolar", "unipolar"):
+                continue
+            rows.append(row)
+            bipolar.append(input_range == "bipolar")
+            invert.append(mapping.invert)
+            multiplier.append(mapping.multiplier)
+            min_pulse.append(bounds[0])
+            span.append(bounds[3])
+
+        self.count = len(rows)
+        self._size = len(servos)
+        self._rows = np.array(rows, dtype=np.intp)
+        self._bipolar = np.array(bipolar, dtype=bool)
+        self._invert = np.array(invert, dtype=bool)
+        self._multiplier = np.array(multiplier, dtype=np.float64)
+        self._min_pulse = np.array(min_pulse, dtype=np.float64)
+        self._span = np.array(span, dtype=np.float64)
+
+    @staticmethod
+    def key_for(servos: Sequence[Any]) -> tuple:
+        """Return the key identifying the configuration of `servos`."""
+        return tuple(
+            (servo, servo.settings.gamepad_mapping, servo.settings.pulse_bounds)
+            for servo in servos
+        )
+
+    def positions(self, value: float) -> np.ndarray:
+        """Compute target positions for one control value.
+
+        Applies the same inversion, normalization, multiplier and scaling
+        steps as the per-servo absolute axis path.
+
+        Args:
+            value: The control value.
+
+        Returns:
+            One position per servo passed to the constructor;
+            `NOT_IN_GROUP` for servos the group does not handle.
+        """
+        values = np.full(self.count, value)
+        values = np.where(self._invert, np.where(self._bipolar, -values, 1.0 - values), values)
+        normalized = np.clip(np.where(self._bipolar, (values + 1.0) * 0.5, values), 0.0, 1.0)
+        scaled = np.clip(0.5 + (normalized - 0.5) * self._multiplier, 0.0, 1.0)
+
+        result = np.full(self._size, NOT_IN_GROUP, dtype=np.int64)
+        result[self._rows] = np.rint(self._min_pulse + scaled * self._span)
+        return result
+
+
+def shared_axis_positions(groups: dict, control_name: str, servos: Sequence[Any],
+                          value: float, min_servos: int) -> Optional[np.ndarray]:
+    """Return vectorized positions for a control's servos, if worthwhile.
+
+    Args:
+        groups: Cache of AxisGroup objects by control name.
+        control_name: The gamepad control.
+        servos: The servos attached to the control.
+        value: The control value.
+        min_servos: Minimum number of absolute-mode servos for which the
+                    vectorized path is used.
+
+    Returns:
+        The positions (see `AxisGroup.positions`), or None if the control
+        has too few absolute-mode servos.
+    """
+    group = groups.get(control_name)
+    if group is None or group.key != AxisGroup.key_for(servos):
+        group = groups[control_name] = AxisGroup(servos)
+    if group.count < min_servos:
+        return None
+    return group.positions(value)
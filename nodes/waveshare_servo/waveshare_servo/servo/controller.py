@@ -14,6 +14,7 @@ from .protocol import (
 )
 from .wiggle import wiggle_servo
 from .calibrate import calibrate_servo
+from .serial_writer import SerialWriter
 from .sdk import (
     PortHandler, 
     PacketHandler, 
@@ -47,10 +48,22 @@ class Servo:
 
     Attributes:
         serial_conn: The shared serial connection object.
+        writer: The write-coalescing SerialWriter shared by all servos on
+                the same connection.
         settings: A ServoSettings data object holding the servo's configuration.
         id: The numerical ID of the servo.
     """
 
+    # Servos are looked up on every gamepad event; slots keep attribute access cheap
+    __slots__ = (
+        "serial_conn",
+        "writer",
+        "settings",
+        "id",
+        "button_state",
+        "last_axis_write_ns",
+    )
+
     def __init__(self, serial_conn, settings: ServoSettings):
         """Initialize a Servo instance.
 
@@ -60,14 +73,35 @@ class Servo:
                       configuration for this servo.
         """
         self.serial_conn = serial_conn
+        self.writer = SerialWriter.for_connection(serial_conn)
         self.settings = settings
         self.id = settings.id
+        # Gamepad state: last button state (0/1) for toggle edge detection and
+        # monotonic time (ns) of the last axis-driven command
+        self.button_state = 0
+        self.last_axis_write_ns = 0
+
+    def axis_position(self, axis_value: float) -> int:
+        """Map a normalized axis value (0.0-1.0) linearly onto the pulse range.
+
+        Inversion is not applied here because `move` already handles it.
+
+        Args:
+            axis_value: The normalized axis value; values outside 0-1 are clamped.
+
+        Returns:
+            The target position, at full pulse resolution.
+        """
+        min_pulse, _, _, span = self.settings.pulse_bounds
+        axis_value = 0.0 if axis_value < 0.0 else 1.0 if axis_value > 1.0 else axis_value
+        return int(round(min_pulse + axis_value * span))
 
     def send_command(self, command: str) -> Optional[str]:
         """Send a command string to the servo and return the response.
 
         Determines the appropriate protocol (SCS binary or text-based) based
-        on the command format and sends it via the serial connection.
+        on the command format and sends it via the shared SerialWriter, so
+        write-only frames are coalesced with other pending frames.
 
         Args:
             command: The command string to send (e.g., "PING", "P1500T1000", "ID2").
@@ -82,7 +116,7 @@ class Servo:
                 
             # Use SCS protocol format for most commands
             if command == "PING":
-                return send_ping_command(self.serial_conn, self.id)
+                return send_ping_command(self.writer, self.id)
             elif command.startswith("P"):
                 # Simple position request with just "P" (for calibration)
                 if len(command) == 1:
@@ -91,7 +125,7 @@ class Servo:
                 elif "T" in command:
                     try:
                         position, time_value = parse_position_command(command)
-                        return send_position_command(self.serial_conn, self.id, position, time_value)
+                        return send_position_command(self.writer, self.id, position, time_value)
                     except Exception as e:
                         print(f"Error parsing position command '{command}': {e}")
                         return None
@@ -111,14 +145,14 @@ class Servo:
                         return None
                         
                     new_id = int(id_str)
-                    return send_id_command(self.serial_conn, self.id, new_id)
+                    return send_id_command(self.writer, self.id, new_id)
                 except Exception as e:
                     print(f"Error parsing ID command '{command}': {e}")
                     return None
             else:
                 # Fallback to text format for other commands
                 print(f"Using text command protocol for: {command}")
-                return send_text_command(self.serial_conn, self.id, command)
+                return send_text_command(self.writer, self.id, command)
                 
             return None
         except Exception as e:
@@ -370,8 +404,7 @@ class Servo:
                 port_handler.closePort()
                 return False
             
-            # Store position in settings for reference
-            self.settings.position = position
+            # settings.position keeps the logical (uninverted) target; callers store it
             
             # Clean up
             port_handler.closePort()
@@ -1,16 +1,36 @@
 """Servo discovery utility for the Waveshare Servo Node."""
 
-import time
-from typing import Set
+import logging
+import re
+from typing import Iterable, Set
 
+from .protocol import build_ping_frame, read_response
 
-def discover_servos(serial_conn) -> Set[int]:
+log = logging.getLogger(__name__)
+
+# Servo IDs probed during discovery
+DISCOVERY_IDS = range(1, 16)  # Limit to likely servo IDs (1-15)
+
+# How long to keep draining replies after the batched PING write (seconds)
+RESPONSE_WINDOW = 0.05
+
+# Start of an SCS status packet: FF FF, a servo ID (not broadcast) and a
+# length of at least 2. Zero-width so overlapping candidates are all seen.
+_STATUS_HEADER_RE = re.compile(rb"(?=\xff\xff[\x00-\xfd][\x02-\xff])")
+
+
+def discover_servos(serial_conn, ids: Iterable[int] = DISCOVERY_IDS) -> Set[int]:
     """Discover connected servos by pinging a range of possible IDs.
 
-    Sends a PING command using the SCS protocol format to IDs 1 through 15.
+    All PING frames (SCS protocol format) are written in a single transfer,
+    then the replies are drained within one response window and parsed
+    together. This costs one serial round trip instead of one per ID.
+    Adapters that echo transmitted bytes on the half-duplex bus return the
+    PING batch ahead of the replies; that echo is dropped before parsing.
 
     Args:
         serial_conn: An open PySerial connection object.
+        ids: The servo IDs to probe (default: 1 through 15).
 
     Returns:
         A set containing the IDs of the servos that responded to the ping.
@@ -19,30 +39,48 @@ def discover_servos(serial_conn) -> Set[int]:
     if not serial_conn or not serial_conn.is_open:
         return set()
 
-    # Scanning with minimal logging
-    discovered_servos = set()
-    
-    # Only try SCS protocol format as it was used in previous implementation
-    for id in range(1, 16):  # Limit to likely servo IDs (1-15)
-        try:
-            # SCS protocol format for ping (based on previous implementation)
-            cmd = bytearray([0xFF, 0xFF, id, 2, 1])
-            checksum = (~sum(cmd[2:]) & 0xFF)
-            cmd.append(checksum)
-            
-            # Send quietly without logging every attempt
-            serial_conn.write(cmd)
-            serial_conn.flush()
-            time.sleep(0.05)  # Short wait for response
-            response = serial_conn.read(serial_conn.in_waiting)
-            
-            # Check response
-            if response and len(response) > 0:
-                discovered_servos.add(id)
-        except Exception as e:
-            print(f"Error while pinging servo {id}: {e}")
-
-    # Only print results when explicitly needed
-    # Logging now happens at the caller level with change detection
-        
-    return discovered_servos
+    ids = list(ids)
+    if not ids:
+        return set()
+
+    batch = b"".join(build_ping_frame(servo_id) for servo_id in ids)
+    try:
+        serial_conn.write(batch)
+        serial_conn.flush()
+        response = read_response(serial_conn, RESPONSE_WINDOW)
+    except Exception as e:
+        log.error("Error while pinging servos %s-%s: %s", ids[0], ids[-1], e)
+        return set()
+
+    # An echoed PING is byte-identical to a status reply with error flag 1
+    if response.startswith(batch):
+        response = response[len(batch):]
+
+    # Logging happens at the caller level with change detection
+    return _parse_status_ids(response) & set(ids)
+
+
+def _parse_status_ids(buffer: bytes) -> Set[int]:
+    """Extract the servo IDs of all valid SCS status packets in a buffer.
+
+    A status packet has the layout ``FF FF ID LEN ERR [PARAMS] CHECKSUM``.
+    Candidate headers are located in one pass by a precompiled regex; only
+    their checksums are verified in Python.
+
+    Args:
+        buffer: The raw bytes read from the serial connection.
+
+    Returns:
+        A set with the IDs of all packets whose checksum is valid.
+    """
+    found = set()
+    resume = 0
+    for match in _STATUS_HEADER_RE.finditer(buffer):
+        start = match.start()
+        if start < resume:
+            continue  # Inside a packet that was already accepted
+        end = start + 4 + buffer[start + 3]
+        if end <= len(buffer) and (~sum(buffer[start + 2:end - 1]) & 0xFF) == buffer[end - 1]:
+            found.add(buffer[start + 2])
+            resume = end
+    return found
@@ -0,0 +1,64 @@
+"""Numeric core of the gamepad-to-servo mapping.
+
+The functions only take and return numbers, so they are compiled with
+`numba` when it is installed. Without it they run as plain Python.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    def njit(*args, **kwargs):
+        """No-op stand-in for `numba.njit`."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def axis_absolute(value: float, bipolar: bool, multiplier: float) -> float:
+    """Map an absolute axis value onto [0, 1].
+
+    Args:
+        value: The axis value, -1..1 if `bipolar` else 0..1.
+        bipolar: Whether the input range is -1..1.
+        multiplier: Sensitivity, applied around the center of the range.
+
+    Returns:
+        The scaled value in [0, 1].
+    """
+    normalized = (value + 1.0) * 0.5 if bipolar else value
+    normalized = 0.0 if normalized < 0.0 else 1.0 if normalized > 1.0 else normalized
+    scaled = 0.5 + (normalized - 0.5) * multiplier
+    return 0.0 if scaled < 0.0 else 1.0 if scaled > 1.0 else scaled
+
+
+@njit(cache=True)
+def axis_relative(value: float, bipolar: bool, step: float, position: float,
+                  min_pulse: float, max_pulse: float) -> float:
+    """Advance a position by one relative-mode step.
+
+    Args:
+        value: The axis value; bipolar inputs give direction and speed,
+               unipolar inputs only speed.
+        bipolar: Whether the input range is -1..1.
+        step: Position change at full deflection; its sign gives the
+              direction for unipolar inputs.
+        position: The current position.
+        min_pulse: Lower position limit.
+        max_pulse: Upper position limit.
+
+    Returns:
+        The new position, clamped to the pulse limits.
+    """
+    if bipolar:
+        rate = -1.0 if value < -1.0 else 1.0 if value > 1.0 else value
+    else:
+        rate = 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
+    target = position + rate * step
+    return min_pulse if target < min_pulse else max_pulse if target > max_pulse else target
+
+
+@njit(cache=True)
+def button_toggle(position: float, min_pulse: float, max_pulse: float, middle: float) -> float:
+    """Return the end a toggle button switches to from `position`."""
+    return min_pulse if position > middle else max_pulse
@@ -1,11 +1,76 @@
 """Data models for the Waveshare Servo Node."""
 
 from dataclasses import asdict, dataclass, field
-from typing import Dict, Optional, Any
+from typing import Dict, NamedTuple, Optional, Any, Tuple
+
+
+class GamepadMapping(NamedTuple):
+    """Pre-parsed view of a servo's `gamepad_config` dictionary.
+
+    Besides the raw options it carries how the mapping is classified, so
+    event handlers do not repeat that work per event:
+
+    Attributes:
+        analog: Treated as an analog axis rather than a button, i.e. the
+                type is axis, or a button in absolute/relative mode or with
+                the isAnalog override.
+        direct_absolute: A plain absolute axis (explicit input range, no
+                         inversion) whose position comes straight from
+                         `Servo.axis_position`.
+    """
+    control_type: Optional[str]
+    mode: Optional[str]
+    invert: bool
+    multiplier: float
+    input_range: Optional[str]
+    is_analog: bool
+    analog: bool
+    direct_absolute: bool
+
+
+def parse_gamepad_config(config: Optional[Dict[str, Any]]) -> Optional[GamepadMapping]:
+    """Parse a gamepad_config dictionary into a GamepadMapping.
+
+    Args:
+        config: The raw gamepad configuration.
+
+    Returns:
+        The parsed mapping, or None if the config is empty or invalid.
+    """
+    if not config:
+        return None
+    try:
+        multiplier = float(config.get("multiplier", 1.0))
+    except (TypeError, ValueError):
+        return None
+    control_type = config.get("type")
+    mode = config.get("mode")
+    invert = bool(config.get("invert", False))
+    input_range = config.get("input_range")
+    is_analog = bool(config.get("isAnalog", False))
+    return GamepadMapping(
+        control_type=control_type,
+        mode=mode,
+        invert=invert,
+        multiplier=multiplier,
+        input_range=input_range,
+        is_analog=is_analog,
+        analog=control_type == "axis" or (
+            control_type == "button" and (mode in ("absolute", "relative") or is_analog)
+        ),
+        direct_absolute=(control_type == "axis" and mode == "absolute" and not invert
+                         and input_range in ("bipolar", "unipolar")),
+    )
+
 
 @dataclass
 class ServoSettings:
-    """Represents settings for a single servo."""
+    """Represents settings for a single servo.
+
+    Assigning `gamepad_config` also refreshes `gamepad_mapping`, so event
+    handlers never have to look the values up in the dictionary. Likewise
+    assigning `min_pulse`/`max_pulse` refreshes `pulse_bounds`.
+    """
     id: int
     alias: str = ""
     min_pulse: int = 0
@@ -23,6 +88,28 @@ class ServoSettings:
         if self.gamepad_config is None:
             self.gamepad_config = {}
 
+    def __setattr__(self, name: str, value: Any):
+        """Set an attribute, keeping the derived gamepad mapping and pulse bounds up to date."""
+        object.__setattr__(self, name, value)
+        if name == "gamepad_config":
+            object.__setattr__(self, "_gamepad_cfg_cache", parse_gamepad_config(value))
+        elif name in ("min_pulse", "max_pulse"):
+            min_pulse, max_pulse = self.min_pulse, self.max_pulse
+            object.__setattr__(
+                self, "_pulse_bounds",
+                (min_pulse, max_pulse, (min_pulse + max_pulse) * 0.5, max_pulse - min_pulse),
+            )
+
+    @property
+    def gamepad_mapping(self) -> Optional[GamepadMapping]:
+        """The parsed `gamepad_config`, or None if no valid mapping is set."""
+        return self._gamepad_cfg_cache
+
+    @property
+    def pulse_bounds(self) -> Tuple[int, int, float, int]:
+        """The `(min_pulse, max_pulse, middle, span)` tuple, updated on assignment."""
+        return self._pulse_bounds
+
     def to_dict(self) -> dict:
         """Convert settings to dictionary for config/json."""
         return asdict(self)
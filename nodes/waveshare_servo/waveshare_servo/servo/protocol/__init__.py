@@ -1,14 +1,24 @@
 """Low-level servo protocol command implementations."""
 
-from .ping_command import send_ping_command
-from .position_command import send_position_command, parse_position_command
+from .ping_command import send_ping_command, build_ping_frame
+from .position_command import (
+    send_position_command,
+    parse_position_command,
+    build_word_write_frame,
+    build_speed_frame,
+)
 from .id_command import send_id_command
 from .text_command import send_text_command
+from .read_response import read_response
 
 __all__ = [
     'send_ping_command',
+    'build_ping_frame',
     'send_position_command',
     'parse_position_command',
+    'build_word_write_frame',
+    'build_speed_frame',
     'send_id_command',
     'send_text_command',
+    'read_response',
 ]
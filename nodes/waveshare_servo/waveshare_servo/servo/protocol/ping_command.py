@@ -1,8 +1,27 @@
 """Function for sending a PING command to a servo."""
 
-import time
 from typing import Optional
 
+from .read_response import read_response
+
+# Size of an SCS status packet without parameters
+STATUS_PACKET_SIZE = 6
+
+
+def build_ping_frame(servo_id: int) -> bytes:
+    """Build an SCS binary PING frame for the given servo ID.
+
+    Args:
+        servo_id: The ID of the servo to ping.
+
+    Returns:
+        The complete frame including header and checksum.
+    """
+    cmd = bytearray([0xFF, 0xFF, servo_id, 2, 1])
+    checksum = (~sum(cmd[2:]) & 0xFF)
+    cmd.append(checksum)
+    return bytes(cmd)
+
 
 def send_ping_command(serial_conn, servo_id: int) -> Optional[str]:
     """Send a PING command using the SCS binary protocol.
@@ -15,14 +34,9 @@ def send_ping_command(serial_conn, servo_id: int) -> Optional[str]:
         "OK" if a response is received, None otherwise.
     """
     try:
-        # Ping command
-        cmd = bytearray([0xFF, 0xFF, servo_id, 2, 1])
-        checksum = (~sum(cmd[2:]) & 0xFF)
-        cmd.append(checksum)
-        serial_conn.write(cmd)
+        serial_conn.write(build_ping_frame(servo_id))
         serial_conn.flush()
-        time.sleep(0.05)
-        binary_response = serial_conn.read(serial_conn.in_waiting)
+        binary_response = read_response(serial_conn, 0.05, size=STATUS_PACKET_SIZE)
         if binary_response:
             return "OK"
         return None
@@ -1,7 +1,68 @@
 """Functions for sending and parsing servo position commands."""
 
-import time
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Control table addresses used by position commands
+ADDR_GOAL_POSITION = 42
+ADDR_MOVING_SPEED = 46
+
+# SCS WRITE instruction and length of a 2-byte write (instr + addr + 2 data + checksum)
+INST_WRITE = 3
+WORD_WRITE_LENGTH = 5
+
+
+@lru_cache(maxsize=None)
+def _word_write_header(servo_id: int, addr: int) -> Tuple[bytes, int]:
+    """Return the fixed part of a 2-byte WRITE frame and its checksum sum.
+
+    Args:
+        servo_id: The target servo ID.
+        addr: The control table address to write.
+
+    Returns:
+        A tuple of the header bytes (``FF FF ID LEN INSTR ADDR``) and the
+        byte sum of the checksummed header fields.
+    """
+    header = bytes([0xFF, 0xFF, servo_id, WORD_WRITE_LENGTH, INST_WRITE, addr])
+    return header, sum(header[2:])
+
+
+def build_word_write_frame(servo_id: int, addr: int, value: int) -> bytes:
+    """Build an SCS WRITE frame setting a 2-byte register.
+
+    Only the data bytes and checksum are computed per call; the header and
+    its partial checksum are cached per servo ID and address.
+
+    Args:
+        servo_id: The target servo ID.
+        addr: The control table address to write.
+        value: The 16-bit value to write (little endian on the wire).
+
+    Returns:
+        The complete frame including checksum.
+    """
+    header, partial = _word_write_header(servo_id, addr)
+    low = value & 0xFF
+    high = (value >> 8) & 0xFF
+    return header + bytes((low, high, ~(partial + low + high) & 0xFF))
+
+
+@lru_cache(maxsize=256)
+def build_speed_frame(servo_id: int, speed: int) -> bytes:
+    """Build (and memoize) the WRITE frame for a servo's moving speed.
+
+    The speed rarely changes between moves, so the whole frame is cached
+    per servo ID and speed value.
+
+    Args:
+        servo_id: The target servo ID.
+        speed: The moving speed value.
+
+    Returns:
+        The complete frame including checksum.
+    """
+    return build_word_write_frame(servo_id, ADDR_MOVING_SPEED, speed)
 
 
 def send_position_command(serial_conn, servo_id: int, position: int, time_value: int) -> Optional[str]:
@@ -22,22 +83,12 @@ def send_position_command(serial_conn, servo_id: int, position: int, time_value:
     try:
         # Send as SCS format
         # Write Goal Position (address 42) for SCS servo
-        addr = 42  # Position address
-        cmd = bytearray([0xFF, 0xFF, servo_id, 5, 3, addr, position & 0xFF, (position >> 8) & 0xFF])
-        checksum = (~sum(cmd[2:]) & 0xFF)
-        cmd.append(checksum)
-        serial_conn.write(cmd)
-        serial_conn.flush()
-        time.sleep(0.05)
-        
+        serial_conn.write(build_word_write_frame(servo_id, ADDR_GOAL_POSITION, position))
+
         # Also set speed if specified
         if time_value > 0:
-            addr = 46  # Speed address
-            cmd = bytearray([0xFF, 0xFF, servo_id, 5, 3, addr, time_value & 0xFF, (time_value >> 8) & 0xFF])
-            checksum = (~sum(cmd[2:]) & 0xFF)
-            cmd.append(checksum)
-            serial_conn.write(cmd)
-            serial_conn.flush()
+            serial_conn.write(build_speed_frame(servo_id, time_value))
+        # No flush: with a SerialWriter both frames go out in one transfer
         return "OK"
     except Exception as e:
         print(f"Error sending position command to servo {servo_id}: {e}")
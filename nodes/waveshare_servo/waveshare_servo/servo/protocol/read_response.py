@@ -0,0 +1,80 @@
+"""Non-blocking response reader for the servo serial connection."""
+
+import selectors
+import time
+from typing import Optional
+
+
+def read_response(
+    serial_conn,
+    timeout: float,
+    terminator: Optional[bytes] = None,
+    size: Optional[int] = None,
+) -> bytes:
+    """Read a servo response without blocking on a fixed sleep or readline.
+
+    Drains whatever bytes are already buffered and only waits (via a selector
+    on the connection's file descriptor) when nothing is available. Returns
+    as soon as the terminator has been seen or `size` bytes were collected,
+    otherwise when the timeout expires.
+
+    Args:
+        serial_conn: The PySerial connection object.
+        timeout: Maximum time in seconds to wait for the response.
+        terminator: Optional byte sequence that marks the end of a response.
+        size: Optional number of bytes after which the response is complete.
+
+    Returns:
+        The bytes received (possibly empty if nothing arrived in time).
+    """
+    buffer = bytearray()
+    deadline = time.monotonic() + timeout
+    selector = _open_selector(serial_conn)
+    try:
+        while True:
+            waiting = serial_conn.in_waiting
+            if waiting:
+                buffer += serial_conn.read(waiting)
+                if terminator is not None and terminator in buffer:
+                    break
+                if size is not None and len(buffer) >= size:
+                    break
+                continue
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if selector:
+                selector.select(remaining)
+            else:
+                time.sleep(min(remaining, 0.001))
+    finally:
+        if selector:
+            selector.close()
+    return bytes(buffer)
+
+
+def _open_selector(serial_conn) -> Optional[selectors.BaseSelector]:
+    """Register the connection's file descriptor for read readiness.
+
+    Args:
+        serial_conn: The PySerial connection object.
+
+    Returns:
+        A selector watching the connection, or None if the connection does
+        not expose a usable file descriptor (polling is used instead).
+    """
+    try:
+        fd = serial_conn.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+    if not isinstance(fd, int):
+        return None
+
+    selector = selectors.DefaultSelector()
+    try:
+        selector.register(fd, selectors.EVENT_READ)
+    except (OSError, ValueError):
+        selector.close()
+        return None
+    return selector
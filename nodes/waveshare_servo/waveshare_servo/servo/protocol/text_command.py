@@ -1,14 +1,16 @@
 """Function for sending text-based commands to servos."""
 
-import time
 from typing import Optional
 
+from .read_response import read_response
+
 
 def send_text_command(serial_conn, servo_id: int, command: str) -> Optional[str]:
     """Send a command using the text-based protocol format.
 
     Formats the command as '#<ID><COMMAND>\r\n' and sends it over the
-    serial connection. Reads and returns the response line.
+    serial connection. Reads and returns the response line, returning as
+    soon as the line terminator arrives.
 
     Args:
         serial_conn: The PySerial connection object.
@@ -23,8 +25,7 @@ def send_text_command(serial_conn, servo_id: int, command: str) -> Optional[str]
         full_command = f"#{servo_id}{command}\r\n"
         serial_conn.write(full_command.encode())
         serial_conn.flush()
-        time.sleep(0.1)
-        response = serial_conn.readline().decode().strip()
+        response = read_response(serial_conn, 0.5, terminator=b"\r\n").decode().strip()
         return response
     except Exception as e:
         print(f"Error sending text command to servo {servo_id}: {e}")
@@ -1,21 +1,66 @@
 """Serial connection manager and servo discovery for the Waveshare Servo Node."""
 
+import logging
+import os
 import time
-from typing import Optional, Set
+from pathlib import Path
+from typing import Dict, List, Optional, Set
 
 import serial
 
+from waveshare_servo.utils import json_codec
+
 from .port_finder import find_servo_port
 from .discovery import discover_servos
+from .serial_writer import SerialWriter
+from .serial_tuning import enable_low_latency
+
+log = logging.getLogger(__name__)
+
+BAUDRATE = 1000000
+
+# File name of the discovery cache inside the user's cache directory
+SCAN_CACHE_FILE = "servo_scan_cache.json"
+
+# Number of cache-verified scans before a full ID sweep is forced again,
+# so newly attached servos are still picked up
+FULL_SCAN_INTERVAL = 10
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory for runtime state.
+
+    Follows the XDG base directory spec: `$XDG_CACHE_HOME/wall-e-dora`,
+    falling back to `~/.cache/wall-e-dora`.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "wall-e-dora"
 
 
 class ServoScanner:
-    """Manages the serial connection and performs servo discovery."""
+    """Manages the serial connection and performs servo discovery.
+
+    The set of servo IDs found on a port is persisted to
+    `$XDG_CACHE_HOME/wall-e-dora/servo_scan_cache.json` (runtime state, kept
+    out of the repository). Periodic scans only ping the cached IDs
+    and fall back to a full sweep when they no longer match, or every
+    `FULL_SCAN_INTERVAL` scans. A newly attached servo is therefore only
+    found by that periodic sweep, up to `FULL_SCAN_INTERVAL` ticks later,
+    unless a cached servo disappears at the same time.
+    """
 
-    def __init__(self):
-        """Initialize the ServoScanner."""
+    def __init__(self, cache_path: Optional[Path] = None):
+        """Initialize the ServoScanner.
+
+        Args:
+            cache_path: Location of the discovery cache file (defaults to
+                        `servo_scan_cache.json` in the user's cache directory).
+        """
         self.port = None
         self.serial_conn = None
+        self.cache_path = Path(cache_path) if cache_path else default_cache_dir() / SCAN_CACHE_FILE
+        self._scan_cache: Optional[Dict[str, List[int]]] = None
+        self._scans_since_sweep = 0
 
     def connect(self) -> bool:
         """Establish a serial connection to the servo controller.
@@ -32,32 +77,94 @@ class ServoScanner:
 
             self.port = find_servo_port()
             if not self.port:
-                print("No servo controller found")
+                log.warning("No servo controller found")
                 return False
 
             # Use the same baud rate as the previous implementation (1000000)
-            self.serial_conn = serial.Serial(self.port, 1000000, timeout=0.5)
+            self.serial_conn = serial.Serial(self.port, BAUDRATE, timeout=0.5)
+            # Drop the USB-serial latency timer (16ms by default) to 1ms
+            enable_low_latency(self.serial_conn)
             time.sleep(0.1)  # Allow time for connection to establish
             return True
         except Exception as e:
-            print(f"Failed to connect to servo controller: {e}")
+            log.error("Failed to connect to servo controller: %s", e)
             return False
 
+    @property
+    def writer(self) -> Optional[SerialWriter]:
+        """The write-coalescing SerialWriter for the current connection, if any."""
+        if self.serial_conn is None:
+            return None
+        return SerialWriter.for_connection(self.serial_conn)
+
     def disconnect(self):
         """Close the serial connection if it's open."""
         if self.serial_conn and self.serial_conn.is_open:
             self.serial_conn.close()
 
-    def discover_servos(self) -> Set[int]:
+    def discover_servos(self, full_scan: bool = False) -> Set[int]:
         """Discover all connected servos by pinging them.
 
-        Ensures a connection is established and then calls the
-        `discover_servos` utility function.
+        Ensures a connection is established, then verifies the cached servo
+        IDs for this port with a single batched ping. A full sweep over all
+        IDs only runs when the cache is empty or stale, when `full_scan` is
+        requested, or after `FULL_SCAN_INTERVAL` cache-verified scans.
+
+        Args:
+            full_scan: Force a sweep over the full ID range.
 
         Returns:
             A set of IDs of the discovered servos.
         """
         if not self.connect():
             return set()
-        
-        return discover_servos(self.serial_conn)
+
+        # Send queued command frames before the bus is used for pinging
+        self.writer.flush()
+
+        cached_ids = self._load_cached_ids()
+        if cached_ids and not full_scan and self._scans_since_sweep < FULL_SCAN_INTERVAL:
+            found = discover_servos(self.serial_conn, sorted(cached_ids))
+            if found == cached_ids:
+                self._scans_since_sweep += 1
+                return found
+
+        found = discover_servos(self.serial_conn)
+        self._scans_since_sweep = 0
+        if found != cached_ids:
+            self._store_cached_ids(found)
+        return found
+
+    def _cache_key(self) -> str:
+        """Key identifying the current port and baud rate in the cache file."""
+        return f"{self.port}@{BAUDRATE}"
+
+    def _load_cached_ids(self) -> Set[int]:
+        """Return the servo IDs cached for the current port.
+
+        The cache file is read once and then kept in memory.
+        """
+        if self._scan_cache is None:
+            try:
+                with open(self.cache_path, "rb") as f:
+                    self._scan_cache = json_codec.loads(f.read())
+            except FileNotFoundError:
+                self._scan_cache = {}
+            except (OSError, ValueError) as e:
+                log.warning("Ignoring unreadable servo scan cache %s: %s", self.cache_path, e)
+                self._scan_cache = {}
+        return set(self._scan_cache.get(self._cache_key(), []))
+
+    def _store_cached_ids(self, ids: Set[int]):
+        """Persist the servo IDs found on the current port.
+
+        Args:
+            ids: The discovered servo IDs.
+        """
+        self._scan_cache[self._cache_key()] = sorted(ids)
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, "wb") as f:
+                f.write(json_codec.dumps_bytes(self._scan_cache))
+        except OSError as e:
+            log.warning("Failed to write servo scan cache %s: %s", self.cache_path, e)
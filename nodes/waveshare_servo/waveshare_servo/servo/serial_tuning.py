@@ -0,0 +1,70 @@
+"""Low-latency tuning for the servo controller's USB-serial port."""
+
+import logging
+import os
+
+try:
+    import termios
+except ImportError:  # Not available on Windows
+    termios = None
+
+log = logging.getLogger(__name__)
+
+# sysfs location of the USB-serial latency timer (FTDI and compatible drivers)
+LATENCY_TIMER_PATH = "/sys/bus/usb-serial/devices/{device}/latency_timer"
+
+
+def enable_low_latency(serial_conn) -> bool:
+    """Minimize the time between a byte arriving and `read()` seeing it.
+
+    Drops the USB-serial latency timer (16ms by default on FTDI chips) to
+    1ms, first through pyserial's ASYNC_LOW_LATENCY support and otherwise
+    by writing the sysfs latency timer. Also sets VMIN=0/VTIME=1 so partial
+    reads return promptly instead of blocking for a full buffer.
+
+    Args:
+        serial_conn: An open PySerial connection object.
+
+    Returns:
+        True if the latency timer could be lowered, False otherwise.
+    """
+    lowered = _set_low_latency_mode(serial_conn) or _write_latency_timer(serial_conn.port)
+    if not lowered:
+        log.info("Low latency mode not available on %s", serial_conn.port)
+    _set_nonblocking_reads(serial_conn)
+    return lowered
+
+
+def _set_low_latency_mode(serial_conn) -> bool:
+    """Enable ASYNC_LOW_LATENCY via pyserial (Linux only)."""
+    try:
+        serial_conn.set_low_latency_mode(True)
+        return True
+    except (AttributeError, ValueError, OSError):
+        return False
+
+
+def _write_latency_timer(port: str) -> bool:
+    """Set the sysfs latency timer of the port's USB-serial device to 1ms."""
+    # Resolve /dev/serial/by-id/... symlinks to the ttyUSB* device name
+    device = os.path.basename(os.path.realpath(port))
+    try:
+        with open(LATENCY_TIMER_PATH.format(device=device), "w") as f:
+            f.write("1")
+        return True
+    except OSError:
+        return False
+
+
+def _set_nonblocking_reads(serial_conn):
+    """Configure VMIN=0/VTIME=1 (at most 100ms block) on the port."""
+    if termios is None:
+        return
+    try:
+        fd = serial_conn.fileno()
+        attrs = termios.tcgetattr(fd)
+        attrs[6][termios.VMIN] = 0
+        attrs[6][termios.VTIME] = 1
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+    except (AttributeError, ValueError, OSError, termios.error) as e:
+        log.info("Could not set VMIN/VTIME on %s: %s", serial_conn.port, e)
@@ -0,0 +1,125 @@
+"""Write-coalescing wrapper around the shared servo serial connection."""
+
+import threading
+import weakref
+from typing import Optional
+
+# Default store-and-forward delay before pending frames are sent (seconds)
+FLUSH_DELAY = 0.002
+
+_writers = weakref.WeakKeyDictionary()
+
+
+class SerialWriter:
+    """Buffers outgoing command frames and sends them in as few writes as possible.
+
+    Frames appended within the flush delay are concatenated and handed to
+    the serial connection in one write, so a burst of commands (e.g. a
+    calibration sequence or moves for several servos) becomes a single
+    USB transfer. Pending frames are sent when the delay expires, when
+    `flush()` is called, or before anything is read from the connection.
+
+    The writer can be passed wherever a serial connection is expected:
+    `write()` appends, reads flush first and then delegate.
+
+    Attributes:
+        flush_delay: Seconds to wait for more frames before sending.
+    """
+
+    def __init__(self, serial_conn, flush_delay: float = FLUSH_DELAY, weak: bool = False):
+        """Initialize the SerialWriter.
+
+        Args:
+            serial_conn: The PySerial connection object to write to.
+            flush_delay: Seconds to wait for more frames before sending.
+            weak: Hold only a weak reference to the connection, so a
+                  registry entry does not keep it alive.
+        """
+        self._conn = weakref.ref(serial_conn) if weak else serial_conn
+        self._weak = weak
+        self.flush_delay = flush_delay
+        self._buffer = bytearray()
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+
+    @property
+    def serial_conn(self):
+        """The underlying PySerial connection object (None once collected)."""
+        return self._conn() if self._weak else self._conn
+
+    @classmethod
+    def for_connection(cls, serial_conn) -> "SerialWriter":
+        """Return the writer shared by everyone using the given connection.
+
+        Args:
+            serial_conn: The PySerial connection object.
+
+        Returns:
+            The SerialWriter bound to this connection.
+        """
+        try:
+            writer = _writers.get(serial_conn)
+            if writer is None:
+                # The registry must not keep the connection alive via its writer
+                writer = cls(serial_conn, weak=True)
+                _writers[serial_conn] = writer
+            return writer
+        except TypeError:
+            # Connection objects that can't be weakly referenced get their own writer
+            return cls(serial_conn)
+
+    def append(self, frame: bytes):
+        """Queue a frame for sending.
+
+        Args:
+            frame: The complete command frame.
+        """
+        with self._lock:
+            self._buffer += frame
+            if self._timer is None:
+                self._timer = threading.Timer(self.flush_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    write = append
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered bytes not yet sent to the connection."""
+        return len(self._buffer)
+
+    def flush(self):
+        """Send all pending frames to the serial connection now."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._buffer:
+                return
+            data = bytes(self._buffer)
+            self._buffer.clear()
+            serial_conn = self.serial_conn
+            if serial_conn is None:
+                return # Connection already gone
+            serial_conn.write(data)
+            serial_conn.flush()
+
+    @property
+    def in_waiting(self) -> int:
+        """Number of bytes waiting to be read (pending frames are sent first)."""
+        self.flush()
+        return self.serial_conn.in_waiting
+
+    def read(self, size: int = 1) -> bytes:
+        """Read from the connection after sending pending frames."""
+        self.flush()
+        return self.serial_conn.read(size)
+
+    def readline(self) -> bytes:
+        """Read a line from the connection after sending pending frames."""
+        self.flush()
+        return self.serial_conn.readline()
+
+    def __getattr__(self, name):
+        """Delegate everything else (port, is_open, fileno, ...) to the connection."""
+        return getattr(self.serial_conn, name)
@@ -1,6 +1,9 @@
 """Provides the wiggle_servo function for servo identification."""
 
 import time
+
+import numpy as np
+
 from .sdk import (
     PortHandler, 
     PacketHandler, 
@@ -16,6 +19,30 @@ ADDR_SCS_PRESENT_POSITION = 56
 BAUDRATE = 1000000
 PROTOCOL_END = 1  # Using protocol_end = 1
 
+# Valid goal position range of the servos
+MIN_POSITION = 0
+MAX_POSITION = 1023
+
+
+def wiggle_trajectory(center: int, wiggle_range: int, iterations: int) -> np.ndarray:
+    """Compute the goal positions of a wiggle sequence.
+
+    The sequence alternates between `center + wiggle_range` and
+    `center - wiggle_range` for `iterations` cycles and ends back at
+    `center`. All positions are clipped to the valid servo range.
+
+    Args:
+        center: The position to wiggle around.
+        wiggle_range: The number of position steps in each direction.
+        iterations: The number of back-and-forth cycles.
+
+    Returns:
+        An integer array of goal positions.
+    """
+    offsets = np.tile(np.array([wiggle_range, -wiggle_range]), iterations)
+    trajectory = np.append(center + offsets, center)
+    return np.clip(trajectory, MIN_POSITION, MAX_POSITION).astype(np.int32)
+
 
 def wiggle_servo(servo, wiggle_range: int = 40, iterations: int = 5) -> bool:
     """Wiggle a servo for identification using the SDK.
@@ -100,49 +127,25 @@ def wiggle_servo(servo, wiggle_range: int = 40, iterations: int = 5) -> bool:
             current_position = 512  # Middle position (1023/2) for these servos
             print(f"Using default middle position: {current_position}")
         
-        # Define target positions for wiggle
-        position_high = current_position + wiggle_range
-        position_low = current_position - wiggle_range
-        
-        # Perform wiggle pattern
-        for i in range(iterations):
-            print(f"Cycle {i+1}: Moving to position {position_high}")
-            scs_comm_result, scs_error = packet_handler.write2ByteTxRx(
-                port_handler, servo_id, ADDR_SCS_GOAL_POSITION, position_high
-            )
-            
-            if scs_comm_result != COMM_SUCCESS or scs_error != 0:
-                print(f"Failed to set position {position_high}.")
-                print(f"  - Result: {packet_handler.getTxRxResult(scs_comm_result)}")
-                if scs_error != 0:
-                    print(f"  - Error: {packet_handler.getRxPacketError(scs_error)}")
-            time.sleep(0.5)  # Wait for movement
-            
-            print(f"Cycle {i+1}: Moving to position {position_low}")
+        # Compute the whole wiggle sequence up front; the last entry restores
+        # the original position
+        trajectory = wiggle_trajectory(current_position, wiggle_range, iterations)
+        for step, position in enumerate(trajectory.tolist()):
+            if step == len(trajectory) - 1:
+                print(f"Restoring servo to original position {position}")
+            else:
+                print(f"Cycle {step // 2 + 1}: Moving to position {position}")
             scs_comm_result, scs_error = packet_handler.write2ByteTxRx(
-                port_handler, servo_id, ADDR_SCS_GOAL_POSITION, position_low
+                port_handler, servo_id, ADDR_SCS_GOAL_POSITION, position
             )
-            
+
             if scs_comm_result != COMM_SUCCESS or scs_error != 0:
-                print(f"Failed to set position {position_low}.")
+                print(f"Failed to set position {position}.")
                 print(f"  - Result: {packet_handler.getTxRxResult(scs_comm_result)}")
                 if scs_error != 0:
                     print(f"  - Error: {packet_handler.getRxPacketError(scs_error)}")
             time.sleep(0.5)  # Wait for movement
-        
-        # Restore servo to original position
-        print(f"Restoring servo to original position {current_position}")
-        scs_comm_result, scs_error = packet_handler.write2ByteTxRx(
-            port_handler, servo_id, ADDR_SCS_GOAL_POSITION, current_position
-        )
-        
-        if scs_comm_result != COMM_SUCCESS or scs_error != 0:
-            print(f"Failed to restore original position.")
-            print(f"  - Result: {packet_handler.getTxRxResult(scs_comm_result)}")
-            if scs_error != 0:
-                print(f"  - Error: {packet_handler.getRxPacketError(scs_error)}")
-        time.sleep(0.5)  # Wait for movement to complete
-        
+
         # Disable torque
         print(f"Disabling torque on servo ID {servo_id}...")
         scs_comm_result, scs_error = packet_handler.write1ByteTxRx(
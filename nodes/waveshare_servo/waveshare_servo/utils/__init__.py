@@ -1,7 +1,19 @@
 """Utility functions for the Waveshare Servo Node."""
 
-from .event_processor import extract_event_data
+from .event_processor import extract_event_data, extract_servo_id
+from . import json_codec
+from .serial_worker import SerialWorker
+from .logging_setup import RateLimitFilter, configure_logging
+from .control_index import rebuild_control_index, index_servo, unindex_servo
 
 __all__ = [
     'extract_event_data',
+    'extract_servo_id',
+    'json_codec',
+    'SerialWorker',
+    'RateLimitFilter',
+    'configure_logging',
+    'rebuild_control_index',
+    'index_servo',
+    'unindex_servo',
 ]
@@ -0,0 +1,62 @@
+"""Inverted index from gamepad control names to the servos attached to them."""
+
+from typing import Any, Dict, List
+
+# Context key holding the {control name: [Servo, ...]} index
+CONTROL_INDEX_KEY = "control_to_servos"
+
+
+def rebuild_control_index(context: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """Rebuild the control index from all active servos.
+
+    Called whenever servos are added to or removed from `context["servos"]`.
+
+    Args:
+        context: The node context dictionary.
+
+    Returns:
+        The new index, which is also stored in the context.
+    """
+    index: Dict[str, List[Any]] = {}
+    for servo in context.get("servos", {}).values():
+        control = getattr(getattr(servo, "settings", None), "attached_control", "")
+        if control:
+            index.setdefault(control, []).append(servo)
+    context[CONTROL_INDEX_KEY] = index
+    return index
+
+
+def unindex_servo(context: Dict[str, Any], servo: Any):
+    """Remove a servo from the control index.
+
+    Args:
+        context: The node context dictionary.
+        servo: The servo to remove.
+    """
+    index = context.get(CONTROL_INDEX_KEY)
+    if index is None:
+        return
+    for control, servos in list(index.items()):
+        if servo in servos:
+            servos.remove(servo)
+            if not servos:
+                del index[control]
+
+
+def index_servo(context: Dict[str, Any], servo: Any):
+    """(Re-)index a servo under its current `attached_control`.
+
+    Must be called after a servo's `attached_control` setting changes.
+
+    Args:
+        context: The node context dictionary.
+        servo: The servo whose attachment changed.
+    """
+    index = context.get(CONTROL_INDEX_KEY)
+    if index is None:
+        # Built lazily on the next lookup
+        return
+    unindex_servo(context, servo)
+    control = servo.settings.attached_control
+    if control:
+        index.setdefault(control, []).append(servo)
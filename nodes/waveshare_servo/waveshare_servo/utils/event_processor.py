@@ -1,9 +1,9 @@
 """Event data extraction utility for the Waveshare Servo Node."""
 
-import json
-import traceback
 from typing import Any, Dict, Optional, Tuple
 
+from . import json_codec
+
 
 def extract_event_data(event: Dict[str, Any]) -> Tuple[Optional[Any], Optional[str]]:
     """Extract data payload from a Dora input event.
@@ -46,19 +46,15 @@ def extract_event_data(event: Dict[str, Any]) -> Tuple[Optional[Any], Optional[s
             # Try to parse JSON if it's a string
             data = data_list[0]
             if isinstance(data, str):
-                try:
-                    return json.loads(data), None
-                except json.JSONDecodeError as e:
-                    return data, None  # Return raw string if not valid JSON
+                return _parse_json(data), None
             else:
                 return data, None  # Return whatever we got
         
         # Handle StructArray or other Arrow types
         elif hasattr(data_field, "to_pylist"):
-            data_list = data_field.to_pylist()
-            if not data_list or len(data_list) == 0:
+            if len(data_field) == 0:
                 return None, "Empty data list"
-            return data_list[0], None
+            return data_field.to_pylist()[0], None
             
         # Direct access for dictionary
         elif isinstance(data_field, dict):
@@ -69,3 +65,39 @@ def extract_event_data(event: Dict[str, Any]) -> Tuple[Optional[Any], Optional[s
             
     except Exception as e:
         return None, f"Error extracting data: {str(e)}"
+
+
+def extract_servo_id(event: Dict[str, Any]) -> Optional[int]:
+    """Extract just the servo `id` from a Dora input event.
+
+    Reads the field straight from the first element of a PyArrow StructArray,
+    the shape sent by the web UI, without converting the whole payload.
+    Other payload shapes fall back to `extract_event_data`.
+
+    Args:
+        event: The Dora input event dictionary.
+
+    Returns:
+        The servo ID, or None if the event carries no usable ID.
+    """
+    try:
+        return int(event["value"][0]["id"].as_py())
+    except (KeyError, IndexError, TypeError, AttributeError, ValueError):
+        pass
+
+    data, error = extract_event_data(event)
+    if not isinstance(data, dict) or data.get("id") is None:
+        return None
+    try:
+        return int(data["id"])
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_json(data: str) -> Any:
+    """Parse a JSON string, returning the raw string if it is not valid JSON."""
+    try:
+        return json_codec.loads(data)
+    except json_codec.JSONDecodeError:
+        return data  # Return raw string if not valid JSON
+
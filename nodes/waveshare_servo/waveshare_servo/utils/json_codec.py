@@ -0,0 +1,58 @@
+"""JSON encoding/decoding for the Waveshare Servo Node.
+
+Uses `orjson` when it is installed and falls back to the standard library
+`json` module otherwise. Both paths produce compact, UTF-8 (not
+ASCII-escaped) output.
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson
+
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def loads(data: Union[str, bytes, memoryview]) -> Any:
+        """Parse a JSON document.
+
+        Args:
+            data: The JSON text as str, bytes or memoryview.
+
+        Returns:
+            The decoded Python object.
+        """
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Serialize an object to a compact JSON string."""
+        return orjson.dumps(obj).decode()
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize an object to compact UTF-8 encoded JSON."""
+        return orjson.dumps(obj)
+
+except ImportError:
+    import json
+
+    JSONDecodeError = json.JSONDecodeError
+
+    def loads(data: Union[str, bytes, memoryview]) -> Any:
+        """Parse a JSON document.
+
+        Args:
+            data: The JSON text as str, bytes or memoryview.
+
+        Returns:
+            The decoded Python object.
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Serialize an object to a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize an object to compact UTF-8 encoded JSON."""
+        return dumps(obj).encode()
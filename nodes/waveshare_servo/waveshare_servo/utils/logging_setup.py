@@ -0,0 +1,68 @@
+"""Logging configuration for the Waveshare Servo Node."""
+
+import logging
+import threading
+import time
+from typing import Dict, Tuple
+
+# Default number of records per second allowed from a single log call site
+DEFAULT_RATE = 10.0
+
+
+class RateLimitFilter(logging.Filter):
+    """Drops log records that repeat faster than a given rate.
+
+    Each call site (logger name + line number) gets its own token bucket,
+    so an error storm from one malformed event stream cannot flood the log
+    or stall the event loop formatting tracebacks, while other messages
+    still get through. The number of dropped records is appended to the
+    next record that passes.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = None):
+        """Initialize the RateLimitFilter.
+
+        Args:
+            rate: Records per second allowed per call site.
+            burst: Maximum number of records let through at once
+                   (defaults to `rate`).
+        """
+        super().__init__()
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._buckets: Dict[Tuple[str, int], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return True if the record may be emitted."""
+        key = (record.name, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                # [tokens, last refill time, dropped since last emit]
+                bucket = self._buckets[key] = [float(self.burst), now, 0]
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens < 1.0:
+                bucket[0] = tokens
+                bucket[2] += 1
+                return False
+            bucket[0] = tokens - 1.0
+            dropped, bucket[2] = bucket[2], 0
+        if dropped:
+            record.msg = f"{record.msg} ({dropped} similar messages suppressed)"
+        return True
+
+
+def configure_logging(level: int = logging.INFO, rate: float = DEFAULT_RATE):
+    """Configure root logging once for the node and install the rate limiter.
+
+    Args:
+        level: The root log level.
+        rate: Records per second allowed per call site.
+    """
+    logging.basicConfig(level=level, format="%(levelname)s %(name)s: %(message)s")
+    for handler in logging.getLogger().handlers:
+        if not any(isinstance(f, RateLimitFilter) for f in handler.filters):
+            handler.addFilter(RateLimitFilter(rate))
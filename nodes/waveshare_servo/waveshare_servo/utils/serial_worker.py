@@ -0,0 +1,66 @@
+"""Background worker that owns blocking servo bus I/O."""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable
+
+log = logging.getLogger(__name__)
+
+
+class SerialWorker:
+    """Runs servo bus operations on a dedicated thread.
+
+    Handlers on the Dora event thread submit blocking operations (e.g.
+    `servo.move`) and continue immediately, so event ingress latency no
+    longer includes serial round trips or retries. Operations run in
+    submission order.
+
+    Handlers that talk to the bus directly must call `wait_idle()` first so
+    they never interleave with queued operations.
+    """
+
+    def __init__(self, name: str = "servo-serial-worker"):
+        """Initialize and start the SerialWorker.
+
+        Args:
+            name: Name of the worker thread.
+        """
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Queue an operation for the worker thread.
+
+        Args:
+            fn: The callable to run on the worker thread.
+            *args: Positional arguments for `fn`.
+
+        Returns:
+            A Future resolved with the result (or exception) of `fn`.
+        """
+        future: Future = Future()
+        self._queue.put((fn, args, future))
+        return future
+
+    def wait_idle(self):
+        """Block until all submitted operations have finished."""
+        if threading.current_thread() is not self._thread:
+            self._queue.join()
+
+    def _run(self):
+        """Worker loop executing queued operations in order."""
+        while True:
+            fn, args, future = self._queue.get()
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args))
+                    except Exception as e:
+                        future.set_exception(e)
+            except Exception as e:
+                log.exception("Serial worker error: %s", e)
+            finally:
+                self._queue.task_done()